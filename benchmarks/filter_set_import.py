@@ -0,0 +1,74 @@
+"""Import time of a module declaring many ``FilterSet`` classes.
+
+Resolvers are built lazily, so only classes used as a dependency pay for them.
+"Eager" resolves the signature of every class right after import, as it was done before.
+
+Usage: python -m benchmarks.filter_set_import
+"""
+
+import inspect
+import sys
+import time
+import types
+
+CLASSES = 200
+USED = 20
+ROUNDS = 5
+
+_HEADER = """\
+from fastapi_filters import FilterField, FilterOperator, FilterSet
+
+
+class Base(FilterSet):
+    id: FilterField[int]
+    created_at: FilterField[str] = FilterField(
+        default_op=FilterOperator.gt,
+        operators=[FilterOperator.gt, FilterOperator.lt],
+    )
+"""
+
+_CLASS = """
+class FilterSet{i}(Base):
+    name: FilterField[str]
+    age: FilterField[int]
+    tags: FilterField[list[str]]
+    score_{i}: FilterField[float]
+"""
+
+
+def _import(code: types.CodeType) -> dict[str, object]:
+    namespace: dict[str, object] = {"__name__": "filter_sets"}
+    exec(code, namespace)  # noqa: S102
+    return namespace
+
+
+def _measure(code: types.CodeType, resolve: int) -> float:
+    best = float("inf")
+
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        namespace = _import(code)
+        for i in range(resolve):
+            inspect.signature(namespace[f"FilterSet{i}"])  # type: ignore[arg-type]
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main() -> None:
+    source = _HEADER + "".join(_CLASS.format(i=i) for i in range(CLASSES))
+    code = compile(source, "filter_sets.py", "exec")
+
+    _import(code)  # warm up imports
+
+    for name, resolve in [
+        ("lazy", 0),
+        (f"{USED} used", USED),
+        ("eager", CLASSES),
+    ]:
+        elapsed = _measure(code, resolve)
+        sys.stdout.write(f"{name:>10}: {elapsed * 1000:8.1f} ms for {CLASSES} FilterSet classes\n")
+
+
+if __name__ == "__main__":
+    main()
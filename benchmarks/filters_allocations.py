@@ -0,0 +1,80 @@
+"""Memory allocated per request while extracting ``FilterValues`` from the filters model.
+
+Compares the ``asdict()``-based extraction with the one used by ``create_filters``.
+
+Usage: python -m benchmarks.filters_allocations
+"""
+
+import sys
+import tracemalloc
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, fields, make_dataclass
+from typing import Any
+
+from fastapi_filters import FilterValues, create_filters
+
+IN_LIST_SIZE = 10_000
+ROUNDS = 100
+
+
+def _asdict_resolver(resolver: Any) -> Callable[[Any], Awaitable[FilterValues]]:
+    defs = resolver.__defs__
+
+    async def _get_filters(f: Any) -> FilterValues:
+        values: FilterValues = defaultdict(dict)
+
+        for key, value in asdict(f).items():
+            if value is not None:
+                name, op = defs[key]
+                values[name][op] = value
+
+        return {**values}
+
+    return _get_filters
+
+
+def _run(coro: Any) -> Any:
+    try:
+        coro.send(None)
+    except StopIteration as exc:
+        return exc.value
+
+    raise RuntimeError("Resolver is not expected to suspend")
+
+
+def _measure(func: Callable[[Any], Awaitable[FilterValues]], model: Any) -> int:
+    total = 0
+
+    tracemalloc.start()
+    for _ in range(ROUNDS):
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        _run(func(model))
+        _, peak = tracemalloc.get_traced_memory()
+        total += peak - before
+    tracemalloc.stop()
+
+    return total // ROUNDS
+
+
+def main() -> None:
+    resolver = create_filters(**{f"field_{i}": int for i in range(40)})
+
+    values = {"field_0__in_": [*range(IN_LIST_SIZE)], "field_1__gt": 10}
+    slots_model = resolver.__model__(**values)
+
+    # same model without __slots__, as it was generated before
+    dict_model_cls = make_dataclass("Filters", [(f.name, f.type, None) for f in fields(resolver.__model__)])
+    dict_model = dict_model_cls(**values)
+
+    for name, func, model in [
+        ("asdict", _asdict_resolver(resolver), dict_model),
+        ("accessors", resolver, slots_model),
+    ]:
+        allocated = _measure(func, model)
+        sys.stdout.write(f"{name:>10}: {allocated / 1024:10.2f} KiB allocated per request\n")
+
+
+if __name__ == "__main__":
+    main()
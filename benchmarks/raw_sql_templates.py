@@ -0,0 +1,51 @@
+"""Time spent in ``ext.raw_sql.apply_filters`` with and without compiled templates cache and in ``ext.fast_sql``.
+
+Usage: python -m benchmarks.raw_sql_templates
+"""
+
+import sys
+import timeit
+
+from sqlalchemy import Integer, String
+
+from fastapi_filters.ext import fast_sql, raw_sql
+from fastapi_filters.ext.raw_sql import apply_filters
+from fastapi_filters.operators import FilterOperator
+from fastapi_filters.types import FilterValues
+
+NUMBER = 2_000
+
+FILTERS: FilterValues = {
+    "age": {FilterOperator.gt: 18, FilterOperator.lt: 65},
+    "name": {FilterOperator.ilike: "%john%"},
+    "id": {FilterOperator.in_: [*range(10)]},
+}
+TYPES = {"age": Integer(), "name": String(), "id": Integer()}
+
+
+def main() -> None:
+    cache = raw_sql._templates_cache  # noqa: SLF001
+
+    for name, maxsize in [("no cache", 0), ("cache", 1024)]:
+        raw_sql._templates_cache = type(cache)(maxsize=maxsize)  # noqa: SLF001
+
+        per_call = (
+            min(
+                timeit.repeat(
+                    lambda: apply_filters(FILTERS, dialect="postgresql+asyncpg", types=TYPES),
+                    number=NUMBER,
+                    repeat=5,
+                ),
+            )
+            / NUMBER
+        )
+        sys.stdout.write(f"{name:>10}: {per_call * 1e6:8.1f} us per call\n")
+
+    raw_sql._templates_cache = cache  # noqa: SLF001
+
+    per_call = min(timeit.repeat(lambda: fast_sql.apply_filters(FILTERS, fields=TYPES), number=NUMBER, repeat=5))
+    sys.stdout.write(f"{'fast_sql':>10}: {per_call / NUMBER * 1e6:8.1f} us per call\n")
+
+
+if __name__ == "__main__":
+    main()
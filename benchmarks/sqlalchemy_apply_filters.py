@@ -0,0 +1,46 @@
+"""Time spent in ``ext.sqlalchemy.apply_filters`` for a statement with 30 conditions.
+
+Usage: python -m benchmarks.sqlalchemy_apply_filters
+"""
+
+import sys
+import timeit
+
+from sqlalchemy import Column, Integer, select
+from sqlalchemy.orm import declarative_base
+
+from fastapi_filters.config import ConfigSnapshot
+from fastapi_filters.ext.sqlalchemy import apply_filters
+from fastapi_filters.operators import FilterOperator
+from fastapi_filters.types import FilterValues
+
+Base = declarative_base()
+
+FIELDS = 10
+OPERATORS = (FilterOperator.gt, FilterOperator.lt, FilterOperator.ne)
+NUMBER = 2_000
+
+
+class Item(Base):
+    __tablename__ = "items"
+
+    id = Column(Integer, primary_key=True)
+
+    locals().update({f"field_{i}": Column(Integer) for i in range(FIELDS)})
+
+
+def main() -> None:
+    stmt = select(Item)
+    filters: FilterValues = {f"field_{i}": dict.fromkeys(OPERATORS, i) for i in range(FIELDS)}
+    config = ConfigSnapshot.capture()
+
+    for name, func in [
+        ("per call snapshot", lambda: apply_filters(stmt, filters)),
+        ("shared snapshot", lambda: apply_filters(stmt, filters, config=config)),
+    ]:
+        per_call = min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER
+        sys.stdout.write(f"{name:>20}: {per_call * 1e6:8.1f} us per call\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""How ``ext.sqlalchemy.apply_filters`` statement build time scales with the number of filters.
+
+Compares ways to attach already built conditions to a statement:
+one ``Select.where`` call per condition (as it was done before), ``where(and_(*conds))``
+and ``where(*conds)`` (used by ``apply_filters``), plus the full ``apply_filters`` call.
+
+Usage: python -m benchmarks.sqlalchemy_filters_scaling
+"""
+
+import sys
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import Column, Integer, and_, select
+from sqlalchemy.orm import declarative_base
+
+from fastapi_filters.config import ConfigSnapshot
+from fastapi_filters.ext.sqlalchemy import apply_filters, generic_condition
+from fastapi_filters.operators import FilterOperator
+from fastapi_filters.types import FilterValues
+
+Base = declarative_base()
+
+FIELDS = 50
+OPERATORS = (FilterOperator.gt, FilterOperator.lt)
+SIZES = (1, 5, 10, 30, 100)
+NUMBER = 500
+
+
+class Item(Base):
+    __tablename__ = "items"
+
+    id = Column(Integer, primary_key=True)
+
+    locals().update({f"field_{i}": Column(Integer) for i in range(FIELDS)})
+
+
+def _chained_where(stmt: Any, conds: list[Any]) -> Any:
+    for cond in conds:
+        stmt = stmt.where(cond)
+
+    return stmt
+
+
+def _timeit(func: Callable[[], Any]) -> float:
+    return min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER
+
+
+def main() -> None:
+    stmt = select(Item)
+    config = ConfigSnapshot.capture()
+
+    columns = ("chained where", "where(and_())", "where(*conds)", "apply_filters")
+    sys.stdout.write(f"{'filters':>8}" + "".join(f"{name:>16}" for name in columns) + "\n")
+
+    for size in SIZES:
+        filters: FilterValues = {}
+        for i in range(size):
+            filters.setdefault(f"field_{i // len(OPERATORS)}", {})[OPERATORS[i % len(OPERATORS)]] = i
+
+        conds = [
+            generic_condition(getattr(Item, field), val, op)
+            for field, field_filters in filters.items()
+            for op, val in field_filters.items()
+        ]
+
+        timings = [
+            _timeit(lambda: _chained_where(stmt, conds)),  # noqa: B023
+            _timeit(lambda: stmt.where(and_(*conds))),  # noqa: B023
+            _timeit(lambda: stmt.where(*conds)),  # noqa: B023
+            _timeit(lambda: apply_filters(stmt, filters, config=config)),  # noqa: B023
+        ]
+        sys.stdout.write(f"{size:>8}" + "".join(f"{t * 1e6:13.1f} us" for t in timings) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Time spent in ``create_filters_from_orm`` / ``create_sorting_from_orm`` at application start.
+
+Every model is used by several routers, "no cache" inspects mapper on every factory call,
+"cache" reuses inspection results per mapper.
+
+Usage: python -m benchmarks.sqlalchemy_orm_factories
+"""
+
+import sys
+import time
+from typing import Any
+
+from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy.orm import configure_mappers, declarative_base
+
+from fastapi_filters.ext import sqlalchemy as ext
+
+MODELS = 300
+ROUTERS = 3
+ROUNDS = 5
+
+
+def _create_models() -> list[Any]:
+    base = declarative_base()
+    models = []
+
+    for i in range(MODELS):
+        attrs: dict[str, Any] = {
+            "__tablename__": f"table_{i}",
+            "id": Column(Integer, primary_key=True),
+            "name": Column(String),
+            "title": Column(String, nullable=False),
+            "score": Column(Float),
+            "count": Column(Integer),
+            "active": Column(Boolean),
+            "created_at": Column(DateTime),
+            "updated_at": Column(DateTime),
+        }
+        if i:
+            attrs["parent_id"] = Column(ForeignKey(f"table_{i - 1}.id"))
+
+        models.append(type(f"Model{i}", (base,), attrs))
+
+    configure_mappers()
+    return models
+
+
+def _create_factories(models: list[Any]) -> None:
+    for model in models:
+        for _ in range(ROUTERS):
+            ext.create_filters_from_orm(model, exclude={"updated_at"})
+            ext.create_sorting_from_orm(model, include={"name", "score", "created_at"})
+
+
+def main() -> None:
+    models = _create_models()
+    columns_cache, types_cache = ext._orm_columns_cache, ext._orm_column_types_cache  # noqa: SLF001
+
+    for name, maxsize in [("no cache", 0), ("cache", 1024)]:
+        best = float("inf")
+
+        for _ in range(ROUNDS):
+            ext._orm_columns_cache = type(columns_cache)(maxsize=maxsize)  # noqa: SLF001
+            ext._orm_column_types_cache = type(types_cache)(maxsize=maxsize)  # noqa: SLF001
+
+            start = time.perf_counter()
+            _create_factories(models)
+            best = min(best, time.perf_counter() - start)
+
+        sys.stdout.write(f"{name:>10}: {best * 1000:8.1f} ms for {MODELS} models x {ROUTERS} routers\n")
+
+    ext._orm_columns_cache, ext._orm_column_types_cache = columns_cache, types_cache  # noqa: SLF001
+
+
+if __name__ == "__main__":
+    main()
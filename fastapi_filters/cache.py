@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    size: int
+    maxsize: int | None
+
+
+class LRUCache(Generic[K, V]):
+    def __init__(self, maxsize: int | None = 128) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[K, V] = OrderedDict()
+        # caches are process-global and used from threadpool (sync endpoints) as well
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            return self._get(key)
+
+    def set(self, key: K, value: V) -> V:
+        with self._lock:
+            return self._set(key, value)
+
+    def _get(self, key: K) -> V | None:
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def _set(self, key: K, value: V) -> V:
+        self._data[key] = value
+        self._data.move_to_end(key)
+
+        if self.maxsize is not None and len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+        return value
+
+    def get_or_create(self, key: K, factory: Callable[[], V]) -> V:
+        value = self.get(key)
+
+        if value is None:
+            value = self.set(key, factory())
+
+        return value
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            size=len(self._data),
+            maxsize=self.maxsize,
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clear()
+
+    def _clear(self) -> None:
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+
+class TTLCache(LRUCache[K, V]):
+    def __init__(
+        self,
+        maxsize: int | None = 128,
+        ttl: float = 60.0,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(maxsize)
+        self.ttl = ttl
+        self.timer = timer
+        self._expires: dict[K, float] = {}
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> V:
+        with self._lock:
+            return self._set(key, value, ttl)
+
+    def _get(self, key: K) -> V | None:
+        if (expires := self._expires.get(key)) is not None and expires <= self.timer():
+            del self._data[key], self._expires[key]
+
+        return super()._get(key)
+
+    def _set(self, key: K, value: V, ttl: float | None = None) -> V:
+        if key not in self._data and self.maxsize is not None and len(self._data) >= self.maxsize:
+            del self._expires[next(iter(self._data))]
+
+        self._expires[key] = self.timer() + (self.ttl if ttl is None else ttl)
+        return super()._set(key, value)
+
+    def _clear(self) -> None:
+        super()._clear()
+        self._expires.clear()
+
+
+def freeze(value: Any) -> Hashable:
+    match value:
+        case dict():
+            return tuple((key, freeze(val)) for key, val in value.items())
+        case list() | tuple():
+            return tuple(freeze(val) for val in value)
+        case set() | frozenset():
+            return frozenset(freeze(val) for val in value)
+
+    hash(value)  # raise TypeError for unhashable values
+    return value  # type: ignore[no-any-return]
+
+
+__all__ = [
+    "CacheStats",
+    "LRUCache",
+    "TTLCache",
+    "freeze",
+]
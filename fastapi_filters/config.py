@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from collections.abc import AsyncIterable, Callable
+from collections.abc import AsyncIterable, Callable, Mapping
 from contextvars import ContextVar, Token
 from dataclasses import dataclass, field
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
+from weakref import WeakSet
 
 T = TypeVar("T")
 
+_registry: WeakSet[ConfigVar[Any]] = WeakSet()
+
 
 @dataclass
 class _ContextVarReset(Generic[T]):
@@ -36,6 +39,8 @@ class ConfigVar(Generic[T]):
         self.default = default
         self.var: ContextVar[T] = ContextVar(name, default=default)
 
+        _registry.add(self)
+
     def set(self, value: T) -> _ContextVarReset[T]:
         token = self.var.set(value)
         return _ContextVarReset(value, self.var, token)
@@ -51,6 +56,28 @@ class ConfigVar(Generic[T]):
         return _dependency
 
 
+def get_config_vars() -> list[ConfigVar[Any]]:
+    return [*_registry]
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    values: Mapping[ConfigVar[Any], Any]
+
+    @classmethod
+    def capture(cls) -> ConfigSnapshot:
+        return cls({var: var.get() for var in _registry})
+
+    def __getitem__(self, var: ConfigVar[T]) -> T:
+        try:
+            return self.values[var]  # type: ignore[no-any-return]
+        except KeyError:
+            # var was created after snapshot was captured
+            return var.get()
+
+
 __all__ = [
+    "ConfigSnapshot",
     "ConfigVar",
+    "get_config_vars",
 ]
@@ -1,4 +1,5 @@
 from .filters import alias_generator_config as alias_generator
+from .filters import filters_resolver_factory_config as filters_resolver_factory
 from .operators import (
     disabled_filters_config as disabled_filters,
 )
@@ -6,10 +7,13 @@ from .operators import (
     filter_operators_generator_config as filter_operators_generator,
 )
 from .schemas import csv_separator_config
+from .simplify import filters_simplification_config as filters_simplification
 
 __all__ = [
     "alias_generator",
     "csv_separator_config",
     "disabled_filters",
     "filter_operators_generator",
+    "filters_resolver_factory",
+    "filters_simplification",
 ]
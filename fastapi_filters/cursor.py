@@ -0,0 +1,56 @@
+import binascii
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Annotated, Any, TypeAlias
+
+from fastapi import Query
+from pydantic import AfterValidator
+from pydantic_core import from_json, to_json
+
+from .types import FilterPlace
+
+CursorValues: TypeAlias = list[Any]
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    return urlsafe_b64encode(to_json([*values])).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> CursorValues:
+    try:
+        values = from_json(urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, ValueError):
+        raise ValueError("Invalid cursor") from None
+
+    if not isinstance(values, list):
+        raise ValueError("Invalid cursor")  # noqa: TRY004
+
+    return values
+
+
+Cursor: TypeAlias = Annotated[str, AfterValidator(decode_cursor)]
+
+
+def create_cursor(
+    *,
+    in_: FilterPlace | None = None,
+    alias: str = "cursor",
+) -> Callable[..., Awaitable[CursorValues | None]]:
+    if in_ is None:
+        in_ = Query
+
+    async def _get_cursor(
+        cursor: Annotated[Cursor | None, in_(alias=alias)] = None,
+    ) -> CursorValues | None:
+        return cursor  # type: ignore[return-value]
+
+    return _get_cursor
+
+
+__all__ = [
+    "Cursor",
+    "CursorValues",
+    "create_cursor",
+    "decode_cursor",
+    "encode_cursor",
+]
@@ -1,14 +1,62 @@
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterator
 from contextlib import asynccontextmanager
-from functools import partial
+from copy import deepcopy
+from functools import cache, partial
 from typing import Any
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
+from fastapi.dependencies.models import Dependant
+from fastapi.openapi.utils import get_openapi
+from fastapi.routing import APIRoute
 from starlette.types import Lifespan
 
+from .utils import async_safe
+
+
+def _iter_dependants(dependant: Dependant) -> Iterator[Dependant]:
+    yield dependant
+
+    for sub_dependant in dependant.dependencies:
+        yield from _iter_dependants(sub_dependant)
+
+
+@cache
+def _get_model_operation(model: type[Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+    async def _endpoint(_: Any = Depends(async_safe(model))) -> None:
+        pass
+
+    openapi = get_openapi(title=model.__name__, version="", routes=[APIRoute("/", _endpoint)])
+    return openapi["paths"]["/"]["get"], openapi.get("components", {}).get("schemas", {})
+
+
+def _add_resolvers_docs(app: FastAPI, openapi: dict[str, Any]) -> None:
+    # resolvers that parse request directly are invisible for FastAPI,
+    # so their parameters should be added to the schema manually
+    for route in app.routes:
+        if not isinstance(route, APIRoute) or not route.include_in_schema:
+            continue
+
+        models = {
+            model: None
+            for dependant in _iter_dependants(route.dependant)
+            if (model := getattr(dependant.call, "__openapi_model__", None)) is not None
+        }
+
+        for model in models:
+            model_operation, model_schemas = _get_model_operation(model)
+
+            for method in route.methods or ():
+                operation = openapi["paths"][route.path_format][method.lower()]
+                operation.setdefault("parameters", []).extend(deepcopy(model_operation["parameters"]))
+                operation["responses"].setdefault("422", deepcopy(model_operation["responses"]["422"]))
+
+            schemas = {**openapi.setdefault("components", {}).get("schemas", {}), **model_schemas}
+            openapi["components"]["schemas"] = {key: schemas[key] for key in sorted(schemas)}
+
 
 def _fix_docs(app: FastAPI) -> None:
     openapi = app.openapi()
+    _add_resolvers_docs(app, openapi)
 
     for endpoints in openapi["paths"].values():
         for endpoint in endpoints.values():
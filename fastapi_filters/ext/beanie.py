@@ -9,6 +9,7 @@ from beanie.odm.operators.find.logical import Not
 from beanie.odm.queries.find import FindMany
 
 from fastapi_filters import FilterOperator, FilterSet, FilterValues
+from fastapi_filters.simplify import filters_simplification_config, simplify_filters
 from fastapi_filters.types import AbstractFilterOperator, SortingValues
 
 DEFAULT_FILTERS: Mapping[AbstractFilterOperator, Callable[..., BaseFindOperator]] = {
@@ -45,6 +46,12 @@ def apply_filters(
     if isinstance(filters, FilterSet):
         filters = filters.filter_values
 
+    if filters_simplification_config.get():
+        if (simplified := simplify_filters(filters)) is None:
+            return cast(TStmt, stmt.find(In("_id", [])))
+
+        filters = simplified
+
     for field, field_filters in filters.items():
         field = remapping.get(field, field)
 
@@ -0,0 +1,317 @@
+from collections.abc import Callable, Collection, Mapping
+from dataclasses import dataclass
+from functools import cache
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, TypeAlias
+
+from fastapi_filters import FilterSet, FilterValues
+from fastapi_filters.operators import FilterOperator
+from fastapi_filters.simplify import filters_simplification_config, simplify_filters
+from fastapi_filters.types import AbstractFilterOperator, SortingDirection, SortingNulls, SortingValues
+
+if TYPE_CHECKING:
+
+    class _BaseCompiledStatement(NamedTuple):
+        stmt: str
+        args: tuple[Any, ...]
+else:
+
+    class _BaseCompiledStatement:
+        stmt: str
+        args: tuple[Any, ...]
+
+        def __getitem__(self, item):
+            if item == 0:
+                return self.stmt
+            if item == 1:
+                return self.args
+
+            raise IndexError("Index out of range for CompiledStatement")
+
+        def __len__(self):
+            return 2
+
+
+# where value of each statement parameter comes from:
+# (index of filter value, None) - value as is, (index, -1) - value as list, (index, n) - n-th item of value
+_ParamSource: TypeAlias = tuple[int, int | None]
+
+
+@dataclass(frozen=True)
+class _SQLTemplate:
+    string: str
+    positional: bool
+    names: tuple[str, ...]
+    sources: tuple[_ParamSource, ...] | None = None
+
+
+@dataclass(kw_only=True)
+class CompiledStatement(_BaseCompiledStatement):  # type: ignore[misc]
+    arg_start: int = 1
+    _template: _SQLTemplate
+    _values: tuple[Any, ...]
+
+    @property
+    def start(self) -> int:
+        return self.end - len(self.args)
+
+    @property
+    def end(self) -> int:
+        return self.arg_start + len(self.args)
+
+    @property
+    def nargs(self) -> int:
+        return len(self.args)
+
+    @property
+    def stmt(self) -> str:
+        return self._template.string
+
+    @property
+    def is_positional(self) -> bool:
+        return self._template.positional
+
+    @property
+    def args(self) -> tuple[Any, ...]:
+        return self._values
+
+    @property
+    def params(self) -> Mapping[str, Any]:
+        return dict(zip(self._template.names, self._values, strict=True))
+
+
+# "postgresql" - asyncpg ($1, $2), "psycopg" - psycopg/psycopg2 (%s), "sqlite" - sqlite3/aiosqlite (?)
+FastSQLDialect: TypeAlias = Literal["postgresql", "psycopg", "sqlite"]
+
+# column, placeholder -> condition
+_OpTemplate: TypeAlias = Callable[[str, str], str]
+
+_COMMON_TEMPLATES: Mapping[AbstractFilterOperator, _OpTemplate] = {
+    FilterOperator.eq: lambda c, p: f"{c} = {p}",
+    FilterOperator.ne: lambda c, p: f"{c} != {p}",
+    FilterOperator.gt: lambda c, p: f"{c} > {p}",
+    FilterOperator.ge: lambda c, p: f"{c} >= {p}",
+    FilterOperator.lt: lambda c, p: f"{c} < {p}",
+    FilterOperator.le: lambda c, p: f"{c} <= {p}",
+    FilterOperator.like: lambda c, p: f"{c} LIKE {p}",
+    FilterOperator.not_like: lambda c, p: f"{c} NOT LIKE {p}",
+}
+_POSTGRESQL_TEMPLATES: Mapping[AbstractFilterOperator, _OpTemplate] = {
+    **_COMMON_TEMPLATES,
+    FilterOperator.ilike: lambda c, p: f"{c} ILIKE {p}",
+    FilterOperator.not_ilike: lambda c, p: f"{c} NOT ILIKE {p}",
+    # whole list is passed as single array parameter
+    FilterOperator.in_: lambda c, p: f"{c} = ANY({p})",
+    FilterOperator.not_in: lambda c, p: f"{c} != ALL({p})",
+    FilterOperator.overlap: lambda c, p: f"{c} && {p}",
+    FilterOperator.not_overlap: lambda c, p: f"NOT ({c} && {p})",
+    FilterOperator.contains: lambda c, p: f"{c} @> {p}",
+    FilterOperator.not_contains: lambda c, p: f"NOT ({c} @> {p})",
+}
+_SQLITE_TEMPLATES: Mapping[AbstractFilterOperator, _OpTemplate] = {
+    **_COMMON_TEMPLATES,
+    FilterOperator.ilike: lambda c, p: f"lower({c}) LIKE lower({p})",
+    FilterOperator.not_ilike: lambda c, p: f"lower({c}) NOT LIKE lower({p})",
+}
+_IN_OPERATORS = frozenset({FilterOperator.in_, FilterOperator.not_in})
+
+_DIALECT_TEMPLATES: Mapping[FastSQLDialect, Mapping[AbstractFilterOperator, _OpTemplate]] = {
+    "postgresql": _POSTGRESQL_TEMPLATES,
+    "psycopg": _POSTGRESQL_TEMPLATES,
+    "sqlite": _SQLITE_TEMPLATES,
+}
+
+_SORT_TEMPLATES: Mapping[tuple[SortingDirection, SortingNulls | None], str] = {
+    ("asc", None): "ASC",
+    ("desc", None): "DESC",
+    ("asc", "bigger"): "ASC NULLS LAST",
+    ("asc", "smaller"): "ASC NULLS FIRST",
+    ("desc", "bigger"): "DESC NULLS FIRST",
+    ("desc", "smaller"): "DESC NULLS LAST",
+}
+
+
+def _quote_part(part: str) -> str:
+    escaped = part.replace('"', '""')
+    return f'"{escaped}"'
+
+
+@cache
+def _quote_identifier(name: str) -> str:
+    return ".".join(map(_quote_part, name.split(".")))
+
+
+def _get_column(
+    field: str,
+    fields: Collection[str] | None,
+    remapping: Mapping[str, str],
+) -> str:
+    if fields is not None and field not in fields:
+        raise ValueError(f"Unknown field {field}")
+
+    return _quote_identifier(remapping.get(field, field))
+
+
+class _Params:
+    def __init__(self, dialect: FastSQLDialect, arg_start: int) -> None:
+        self.dialect = dialect
+        self.arg_start = arg_start
+        self.values: list[Any] = []
+
+    def add(self, value: Any) -> str:
+        self.values.append(value)
+
+        if self.dialect == "postgresql":
+            return f"${self.arg_start + len(self.values) - 1}"
+        if self.dialect == "psycopg":
+            return "%s"
+
+        return "?"
+
+    def compiled(self, stmt: str) -> CompiledStatement:
+        names = tuple(f"param_{pos}" for pos in range(self.arg_start, self.arg_start + len(self.values)))
+
+        return CompiledStatement(  # type: ignore[call-arg]
+            arg_start=self.arg_start,
+            _template=_SQLTemplate(string=stmt, positional=True, names=names),
+            _values=tuple(self.values),
+        )
+
+
+def _in_list_condition(column: str, op: AbstractFilterOperator, val: Any, params: _Params) -> str:
+    # sqlite has no arrays, so each value is bound separately
+    values = [*val]
+    if not values:
+        return "1 != 1" if op == FilterOperator.in_ else "1 = 1"
+
+    placeholders = ", ".join([params.add(v) for v in values])
+    return f"{column} IN ({placeholders})" if op == FilterOperator.in_ else f"{column} NOT IN ({placeholders})"
+
+
+def _condition(
+    column: str,
+    op: AbstractFilterOperator,
+    val: Any,
+    params: _Params,
+    templates: Mapping[AbstractFilterOperator, _OpTemplate],
+) -> str:
+    if op == FilterOperator.is_null:
+        return f"{column} IS NULL" if val else f"{column} IS NOT NULL"
+    if op in _IN_OPERATORS:
+        if op not in templates:
+            return _in_list_condition(column, op, val, params)
+
+        val = [*val]
+
+    if template := templates.get(op):
+        return template(column, params.add(val))
+
+    raise NotImplementedError(f"Operator {op} is not implemented")
+
+
+def apply_filters(
+    filters: FilterValues | FilterSet,
+    *,
+    fields: Collection[str] | None = None,
+    remapping: Mapping[str, str] | None = None,
+    dialect: FastSQLDialect = "postgresql",
+    arg_start: int | None = None,
+) -> CompiledStatement | None:
+    remapping = remapping or {}
+    if isinstance(filters, FilterSet):
+        fields = type(filters).__filters__.keys() if fields is None else fields
+        filters = filters.filter_values
+
+    if not filters:
+        return None
+
+    if fields is None:
+        raise ValueError("fields are required to apply filters values")
+
+    params = _Params(dialect, 1 if arg_start is None else arg_start)
+
+    if filters_simplification_config.get():
+        if (simplified := simplify_filters(filters, sql_nulls=True)) is None:
+            return params.compiled("1 != 1")
+
+        filters = simplified
+
+    templates = _DIALECT_TEMPLATES[dialect]
+
+    conditions = [
+        _condition(_get_column(field, fields, remapping), op, val, params, templates)
+        for field, field_filters in filters.items()
+        for op, val in field_filters.items()
+    ]
+
+    return params.compiled(" AND ".join(conditions))
+
+
+def apply_sorting(
+    sorting: SortingValues,
+    *,
+    fields: Collection[str] | None = None,
+    remapping: Mapping[str, str] | None = None,
+    dialect: FastSQLDialect = "postgresql",
+    arg_start: int | None = None,
+) -> CompiledStatement | None:
+    remapping = remapping or {}
+
+    if not sorting:
+        return None
+
+    if fields is None:
+        raise ValueError("fields are required to apply sorting values")
+
+    clauses: list[str] = []
+    for field, direction, nulls in sorting:
+        try:
+            order = _SORT_TEMPLATES[direction, nulls]
+        except KeyError:
+            raise ValueError(f"Unknown sorting direction {direction}") from None
+
+        clauses.append(f"{_get_column(field, fields, remapping)} {order}")
+
+    return _Params(dialect, 1 if arg_start is None else arg_start).compiled(", ".join(clauses))
+
+
+def apply_filters_and_sorting(
+    filters: FilterValues | FilterSet,
+    sorting: SortingValues,
+    *,
+    fields: Collection[str] | None = None,
+    remapping: Mapping[str, str] | None = None,
+    dialect: FastSQLDialect = "postgresql",
+    arg_start: int | None = None,
+) -> tuple[CompiledStatement | None, CompiledStatement | None]:
+    if isinstance(filters, FilterSet) and fields is None:
+        fields = type(filters).__filters__.keys()
+
+    filters_res = apply_filters(
+        filters,
+        fields=fields,
+        remapping=remapping,
+        dialect=dialect,
+        arg_start=arg_start,
+    )
+
+    if filters_res:
+        arg_start = filters_res.end
+
+    sorting_res = apply_sorting(
+        sorting,
+        fields=fields,
+        remapping=remapping,
+        dialect=dialect,
+        arg_start=arg_start,
+    )
+
+    return filters_res, sorting_res
+
+
+__all__ = [
+    "CompiledStatement",
+    "FastSQLDialect",
+    "apply_filters",
+    "apply_filters_and_sorting",
+    "apply_sorting",
+]
@@ -1,19 +1,33 @@
-import re
-from collections.abc import Mapping
-from dataclasses import dataclass
-from functools import cache, cached_property
-from typing import TYPE_CHECKING, Any, NamedTuple, TypeAlias, cast
+from collections.abc import Hashable, Mapping, Sequence
+from functools import cache
+from typing import Any, TypeAlias, cast
 
-from sqlalchemy import Dialect, column, make_url, select
+from sqlalchemy import Dialect, column, false, make_url, select
 from sqlalchemy.sql import ClauseElement
-from sqlalchemy.sql.compiler import StrSQLCompiler
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.elements import BindParameter
 from sqlalchemy.sql.type_api import TypeEngine
+from sqlalchemy.sql.visitors import iterate
 
 from fastapi_filters import FilterSet, FilterValues
-from fastapi_filters.config import ConfigVar
-from fastapi_filters.types import SortingValues
-
-from .sqlalchemy import DEFAULT_FILTERS, SORT_FUNCS, SORT_NULLS_FUNCS
+from fastapi_filters.cache import CacheStats, LRUCache, freeze
+from fastapi_filters.config import ConfigSnapshot, ConfigVar
+from fastapi_filters.operators import FilterOperator
+from fastapi_filters.simplify import filters_simplification_config, simplify_filters
+from fastapi_filters.types import AbstractFilterOperator, SortingValues
+
+from .fast_sql import CompiledStatement, _ParamSource, _SQLTemplate
+from .sqlalchemy import (
+    _LIKE_OPERATORS,
+    DEFAULT_FILTERS,
+    SORT_FUNCS,
+    SORT_NULLS_FUNCS,
+    _generic_condition,
+    _get_like_prefix,
+    in_list_offload_threshold,
+    in_list_strategy,
+    like_prefix_rewrite,
+)
 
 _Dialect: TypeAlias = str | None
 _SQLType: TypeAlias = TypeEngine[Any] | type[TypeEngine[Any]]
@@ -22,7 +36,7 @@ default_dialect: ConfigVar[_Dialect] = ConfigVar(
     name="default_dialect",
     default=None,
 )
-default_compile_kwargs: ConfigVar[_Dialect] = ConfigVar(
+default_compile_kwargs: ConfigVar[Mapping[str, Any] | None] = ConfigVar(
     name="default_compile_kwargs",
     default=None,
 )
@@ -33,86 +47,73 @@ def _get_dialect(dialect: str) -> Dialect:
     return make_url(f"{dialect}://").get_dialect()()
 
 
-if TYPE_CHECKING:
-
-    class _BaseCompiledStatement(NamedTuple):
-        stmt: str
-        args: tuple[Any, ...]
-else:
-
-    class _BaseCompiledStatement:
-        stmt: str
-        args: tuple[Any, ...]
-
-        def __getitem__(self, item):
-            if item == 0:
-                return self.stmt
-            if item == 1:
-                return self.args
-
-            raise IndexError("Index out of range for CompiledStatement")
-
-        def __len__(self):
-            return 2
-
+# numeric placeholders ($1, :1) are numbered by SQLAlchemy starting from 1,
+# so such statements are compiled with named markers and numbered from arg_start afterwards
+_NUMERIC_PARAMSTYLES: Mapping[str, str] = {
+    "numeric": ":",
+    "numeric_dollar": "$",
+}
 
-def _adjust_args_pos_in_statement(
-    num_char: str,
-    stmt: str,
-    arg_start: int,
-) -> str:
-    regex = re.compile(rf"\{num_char}(\d+)")
 
-    return regex.sub(
-        lambda match: f"{num_char}{int(match.group(1)) + arg_start - 1}",
-        stmt,
-    )
+@cache
+def _get_markers_dialect(dialect: str) -> Dialect:
+    return make_url(f"{dialect}://").get_dialect()(paramstyle="pyformat")  # type: ignore[call-arg]
 
 
-@dataclass(kw_only=True)
-class CompiledStatement(_BaseCompiledStatement):  # type: ignore[misc]
-    arg_start: int = 1
-    _compiled: StrSQLCompiler
+class _NumericPlaceholders:
+    def __init__(self, num_char: str, arg_start: int) -> None:
+        self.num_char = num_char
+        self.arg_start = arg_start
+        self.positions: dict[str, str] = {}
 
-    @property
-    def start(self) -> int:
-        return self.arg_start + self.end - len(self.args)
+    def __getitem__(self, name: str) -> str:
+        try:
+            return self.positions[name]
+        except KeyError:
+            pos = self.positions[name] = f"{self.num_char}{self.arg_start + len(self.positions)}"
+            return pos
 
-    @property
-    def end(self) -> int:
-        return self.arg_start + len(self.args)
 
-    @property
-    def nargs(self) -> int:
-        return len(self.args)
+def _number_placeholders(stmt: str, num_char: str, arg_start: int) -> tuple[str, tuple[str, ...]]:
+    # markers are substituted in order of appearance, literal "%" are escaped as "%%" by pyformat compiler
+    placeholders = _NumericPlaceholders(num_char, arg_start)
+    stmt %= placeholders
 
-    @cached_property
-    def stmt(self) -> str:
-        if self.is_positional and self.arg_start != 1:
-            return _adjust_args_pos_in_statement(
-                num_char=self._compiled._numeric_binds_identifier_char,
-                stmt=self._compiled.string,
-                arg_start=self.arg_start,
-            )
+    return stmt, tuple(placeholders.positions)
 
-        return self._compiled.string
 
-    @property
-    def is_positional(self) -> bool:
-        return self._compiled.positional
+_AS_LIST = -1
 
-    @property
-    def args(self) -> tuple[Any, ...]:
-        params = self._compiled.params
 
-        if self.is_positional:
-            return tuple(params[name] for name in self._compiled.positiontup or ())
+def _compile_template(
+    stmt: ClauseElement,
+    *,
+    dialect: _Dialect | None,
+    arg_start: int,
+    config: ConfigSnapshot,
+) -> tuple[_SQLTemplate, SQLCompiler]:
+    sa_dialect: Dialect | None = _get_dialect(dialect) if dialect else None
+    num_char = _NUMERIC_PARAMSTYLES.get(sa_dialect.paramstyle) if sa_dialect else None
+
+    if dialect and num_char:
+        sa_dialect = _get_markers_dialect(dialect)
+
+    compile_kwargs = config[default_compile_kwargs] or {}
+    compiled = cast(
+        SQLCompiler,
+        stmt.compile(
+            dialect=sa_dialect,
+            # expand IN lists into placeholders, raw statement can not be post-processed by SQLAlchemy
+            compile_kwargs={"render_postcompile": True, **compile_kwargs},
+        ),
+    )
 
-        return tuple(params.values())
+    if num_char:
+        string, names = _number_placeholders(compiled.string, num_char, arg_start)
+        return _SQLTemplate(string=string, positional=True, names=names), compiled
 
-    @property
-    def params(self) -> Mapping[str, Any]:
-        return cast(Mapping[str, Any], self._compiled.params)
+    names = tuple(compiled.positiontup or ()) if compiled.positional else tuple(compiled.params)
+    return _SQLTemplate(string=compiled.string, positional=compiled.positional, names=names), compiled
 
 
 def _compile_sql(
@@ -120,21 +121,169 @@ def _compile_sql(
     *,
     dialect: _Dialect | None = None,
     arg_start: int | None = None,
+    config: ConfigSnapshot | None = None,
 ) -> CompiledStatement:
-    dialect = dialect or default_dialect.get()
-    sa_dialect: Dialect | None = _get_dialect(dialect) if dialect else None
+    if config is None:
+        config = ConfigSnapshot.capture()
+
+    dialect = dialect or config[default_dialect]
 
     if arg_start is None:
         arg_start = 1
 
-    compiled = stmt.compile(
-        dialect=sa_dialect,
-        compile_kwargs=default_compile_kwargs.get() or {},
+    template, compiled = _compile_template(stmt, dialect=dialect, arg_start=arg_start, config=config)
+    params = compiled.params
+
+    return CompiledStatement(  # type: ignore[call-arg]
+        arg_start=arg_start,
+        _template=template,
+        _values=tuple(params[name] for name in template.names),
     )
 
+
+_FilterItem: TypeAlias = tuple[str, AbstractFilterOperator, Any]
+
+_templates_cache: LRUCache[Hashable, _SQLTemplate] = LRUCache(maxsize=1024)
+
+
+def templates_cache_stats() -> CacheStats:
+    return _templates_cache.stats()
+
+
+def _get_value_kind(op: AbstractFilterOperator, val: Any) -> Hashable:
+    if op == FilterOperator.is_null:
+        return bool(val)
+    if isinstance(val, list | tuple | set | frozenset):
+        # number of placeholders and types of parameters depend on items
+        return "seq", len(val), frozenset(map(type, val))
+    if isinstance(val, str) and op in _LIKE_OPERATORS:
+        # prefix patterns can be compiled into range condition
+        return str, _get_like_prefix(val) is not None
+
+    return cast(Hashable, type(val))
+
+
+def _get_type_key(type_: _SQLType | None) -> Hashable:
+    if isinstance(type_, TypeEngine):
+        return type_._static_cache_key  # noqa: SLF001
+
+    return cast(Hashable, type_)
+
+
+def _get_template_key(
+    items: Sequence[_FilterItem],
+    types: Mapping[str, _SQLType],
+    dialect: _Dialect | None,
+    arg_start: int,
+    config: ConfigSnapshot,
+) -> Hashable | None:
+    try:
+        return (
+            tuple((field, op, _get_value_kind(op, val), _get_type_key(types.get(field))) for field, op, val in items),
+            dialect,
+            arg_start,
+            config[in_list_strategy],
+            config[in_list_offload_threshold],
+            config[like_prefix_rewrite],
+            freeze(config[default_compile_kwargs]),
+        )
+    except TypeError:  # unhashable compile kwargs or types
+        return None
+
+
+def _get_param_sources(
+    compiled: SQLCompiler,
+    template: _SQLTemplate,
+    conditions: Sequence[ClauseElement],
+    items: Sequence[_FilterItem],
+) -> tuple[_ParamSource, ...] | None:
+    origins: dict[BindParameter[Any], int] = {
+        elem: idx
+        for idx, condition in enumerate(conditions)
+        for elem in iterate(condition)
+        if isinstance(elem, BindParameter)
+    }
+
+    sources: dict[str, _ParamSource] = {}
+    rendered: set[BindParameter[Any]] = set()
+    for bind, name in compiled.bind_names.items():
+        origin = next((b for b in bind._cloned_set if b in origins), None)  # noqa: SLF001
+        if origin is None:
+            return None
+
+        rendered.add(origin)
+        idx = origins[origin]
+        val = items[idx][2]
+        if bind.expanding:
+            values = [*val]
+            positions = [min(i, len(values) - 1) for i in range(len(bind.value or ()))]
+
+            if bind.value != [values[i] for i in positions]:
+                return None
+
+            sources.update({f"{name}_{i}": (idx, pos) for i, pos in enumerate(positions, 1)})
+        elif bind.value is val:
+            sources[name] = (idx, None)
+        elif isinstance(val, list | tuple | set | frozenset) and bind.value == [*val]:
+            sources[name] = (idx, _AS_LIST)
+        else:
+            return None
+
+    # values rendered inline (literal binds/literal execute) make statement unique for values
+    if len(rendered) != len(origins) or sources.keys() != {*template.names}:
+        return None
+
+    return tuple(sources[name] for name in template.names)
+
+
+def _get_param_value(values: Sequence[Any], source: _ParamSource) -> Any:
+    idx, item = source
+    val = values[idx]
+
+    if item is None:
+        return val
+    if item == _AS_LIST:
+        return [*val]
+    if isinstance(val, set | frozenset):
+        val = [*val]
+
+    return val[item]
+
+
+def _compile_filters(
+    items: Sequence[_FilterItem],
+    types: Mapping[str, _SQLType],
+    dialect: _Dialect | None,
+    arg_start: int,
+    config: ConfigSnapshot,
+) -> CompiledStatement:
+    key = _get_template_key(items, types, dialect, arg_start, config)
+
+    if key is not None and (template := _templates_cache.get(key)) and template.sources is not None:
+        values = [val for *_, val in items]
+
+        return CompiledStatement(  # type: ignore[call-arg]
+            arg_start=arg_start,
+            _template=template,
+            _values=tuple(_get_param_value(values, source) for source in template.sources),
+        )
+
+    conditions = [
+        _generic_condition(column(field, type_=types.get(field)), op, val, config) for field, op, val in items
+    ]
+    stmt = cast(ClauseElement, select(1).where(*conditions).whereclause)
+
+    template, compiled = _compile_template(stmt, dialect=dialect, arg_start=arg_start, config=config)
+    params = compiled.params
+
+    if key is not None and key not in _templates_cache:
+        sources = _get_param_sources(compiled, template, conditions, items)
+        _templates_cache.set(key, _SQLTemplate(**{**template.__dict__, "sources": sources}))
+
     return CompiledStatement(  # type: ignore[call-arg]
         arg_start=arg_start,
-        _compiled=cast(StrSQLCompiler, compiled),
+        _template=template,
+        _values=tuple(params[name] for name in template.names),
     )
 
 
@@ -145,6 +294,7 @@ def apply_filters(
     types: Mapping[str, _SQLType] | None = None,
     dialect: _Dialect | None = None,
     arg_start: int | None = None,
+    config: ConfigSnapshot | None = None,
 ) -> CompiledStatement | None:
     types = types or {}
     remapping = remapping or {}
@@ -154,21 +304,31 @@ def apply_filters(
     if not filters:
         return None
 
-    stmt = select(1)
+    if config is None:
+        config = ConfigSnapshot.capture()
+
+    if config[filters_simplification_config]:
+        if (simplified := simplify_filters(filters, sql_nulls=True)) is None:
+            return _compile_sql(false(), dialect=dialect, arg_start=arg_start, config=config)
+
+        filters = simplified
+
+    items: list[_FilterItem] = []
     for field, field_filters in filters.items():
         field = remapping.get(field, field)
 
         for op, val in field_filters.items():
-            if (cond := DEFAULT_FILTERS.get(op)) is not None:
-                col = column(field, type_=types.get(field))
-                stmt = stmt.where(cond(col, val))
+            if op in DEFAULT_FILTERS:
+                items.append((field, op, val))
             else:
                 raise NotImplementedError(f"Operator {op} is not implemented")
 
-    return _compile_sql(
-        cast(ClauseElement, stmt.whereclause),
-        dialect=dialect,
-        arg_start=arg_start,
+    return _compile_filters(
+        items,
+        types,
+        dialect or config[default_dialect],
+        1 if arg_start is None else arg_start,
+        config,
     )
 
 
@@ -179,6 +339,7 @@ def apply_sorting(
     dialect: _Dialect | None = None,
     types: Mapping[str, _SQLType] | None = None,
     arg_start: int | None = None,
+    config: ConfigSnapshot | None = None,
 ) -> CompiledStatement | None:
     types = types or {}
     remapping = remapping or {}
@@ -205,6 +366,7 @@ def apply_sorting(
         stmt._order_by_clause,
         dialect=dialect,
         arg_start=arg_start,
+        config=config,
     )
 
 
@@ -216,13 +378,18 @@ def apply_filters_and_sorting(
     remapping: Mapping[str, str] | None = None,
     types: Mapping[str, _SQLType] | None = None,
     arg_start: int | None = None,
+    config: ConfigSnapshot | None = None,
 ) -> tuple[CompiledStatement | None, CompiledStatement | None]:
+    if config is None:
+        config = ConfigSnapshot.capture()
+
     filters_res = apply_filters(
         filters,
         arg_start=arg_start,
         remapping=remapping,
         types=types,
         dialect=dialect,
+        config=config,
     )
 
     if filters_res and filters_res.is_positional:
@@ -234,6 +401,7 @@ def apply_filters_and_sorting(
         remapping=remapping,
         types=types,
         dialect=dialect,
+        config=config,
     )
 
     return filters_res, sorting_res
@@ -246,4 +414,5 @@ __all__ = [
     "apply_sorting",
     "default_compile_kwargs",
     "default_dialect",
+    "templates_cache_stats",
 ]
@@ -1,30 +1,70 @@
+import asyncio
+import csv
+import io
+import json
 import operator
-from collections.abc import Callable, Container, Iterator, Mapping
+import sys
+import weakref
+from collections.abc import AsyncIterator, Callable, Container, Hashable, Iterable, Iterator, Mapping, Sequence
 from contextlib import suppress
+from dataclasses import dataclass
+from functools import cache, partial
 from typing import (
+    TYPE_CHECKING,
     Any,
+    Generic,
+    Literal,
     TypeAlias,
     TypeVar,
     cast,
 )
 
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import to_json
 from sqlalchemy import (
     ARRAY,
+    Boolean,
     ColumnExpressionArgument,
+    all_,
+    and_,
+    any_,
     asc,
+    bindparam,
+    collate,
     desc,
+    event,
+    false,
+    func,
     inspect,
+    literal_column,
     nulls_first,
     nulls_last,
+    or_,
+    select,
+    tuple_,
 )
-from sqlalchemy.orm import ColumnProperty
-from sqlalchemy.sql.selectable import Select
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import ColumnProperty, Mapper, aliased
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.elements import BindParameter, ClauseElement, ColumnElement
+from sqlalchemy.sql.operators import OperatorType
+from sqlalchemy.sql.selectable import FromClause, Select
+from sqlalchemy.sql.sqltypes import NullType
+from sqlalchemy.sql.util import find_tables
+from sqlalchemy.sql.visitors import InternalTraversal, iterate
 
 from fastapi_filters import FilterField, create_filters
-from fastapi_filters.config import ConfigVar
+from fastapi_filters.cache import CacheStats, LRUCache, TTLCache, freeze
+from fastapi_filters.config import ConfigSnapshot, ConfigVar
+from fastapi_filters.cursor import CursorValues, encode_cursor
 from fastapi_filters.filter_set import FilterSet
 from fastapi_filters.filters import FiltersCreateHooks
 from fastapi_filters.operators import FilterOperator
+from fastapi_filters.simplify import filters_simplification_config, simplify_filters
 from fastapi_filters.sorters import create_sorting
 from fastapi_filters.types import (
     AbstractFilterOperator,
@@ -40,6 +80,10 @@ from fastapi_filters.types import (
 )
 from fastapi_filters.utils import fields_include_exclude
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+T = TypeVar("T")
 TSelectable = TypeVar("TSelectable", bound=Select[Any])
 
 
@@ -90,10 +134,13 @@ EntityNamespace: TypeAlias = Mapping[str, Any]
 AdditionalNamespace: TypeAlias = Mapping[str | FilterField[Any], Any]
 
 
-def _get_entity_namespace(stmt: TSelectable) -> EntityNamespace:
+_entity_namespace_cache: LRUCache[Hashable, EntityNamespace] = LRUCache(maxsize=256)
+
+
+def _build_entity_namespace(froms: Sequence[FromClause]) -> EntityNamespace:
     ns = {}
 
-    for entity in reversed(stmt.get_final_froms()):
+    for entity in reversed(froms):
         for name, clause in reversed(entity.c.items()):
             ns[name] = clause
             ns[clause.name] = clause
@@ -108,6 +155,54 @@ def _get_entity_namespace(stmt: TSelectable) -> EntityNamespace:
     return ns
 
 
+# same statement is used for namespace and filters shape lookups within one call,
+# keys are weakly referenced, so statements (and their bound values) are not kept alive by the cache
+_stmt_cache_keys: weakref.WeakKeyDictionary[Select[Any], Hashable | None] = weakref.WeakKeyDictionary()
+
+
+def _get_stmt_cache_key(stmt: Select[Any]) -> Hashable | None:
+    try:
+        return _stmt_cache_keys[stmt]
+    except KeyError:
+        key = _stmt_cache_keys[stmt] = _generate_stmt_cache_key(stmt)
+        return key
+
+
+def _generate_stmt_cache_key(stmt: Select[Any]) -> Hashable | None:
+    cache_key = stmt._generate_cache_key()  # noqa: SLF001
+    if cache_key is None:
+        return None
+
+    # cache key treats anonymous aliases and same-named FROM objects (tables, CTEs, table valued functions)
+    # as equal, but namespace columns must belong to the FROM objects of this statement
+    froms = dict.fromkeys(elem for elem in iterate(stmt) if isinstance(elem, FromClause))
+    try:
+        entities = tuple(weakref.ref(from_) for from_ in froms)
+    except TypeError:  # not weak referenceable
+        return None
+
+    return cache_key.key, entities
+
+
+def _get_entity_namespace(stmt: Select[Any]) -> EntityNamespace:
+    # get_final_froms compiles the statement, so namespace is cached by statement cache key
+    # (structure only, without bound values) instead of FROM objects
+    if (key := _get_stmt_cache_key(stmt)) is None:
+        return _build_entity_namespace(stmt.get_final_froms())
+
+    return _entity_namespace_cache.get_or_create(
+        key,
+        lambda: _build_entity_namespace(stmt.get_final_froms()),
+    )
+
+
+def _get_namespace(stmt: Select[Any], additional: AdditionalNamespace | None) -> EntityNamespace:
+    return {
+        **_get_entity_namespace(stmt),
+        **_normalize_additional_namespace(additional or {}),
+    }
+
+
 def _normalize_additional_namespace(additional: AdditionalNamespace) -> EntityNamespace:
     ns = {}
     for key, value in additional.items():
@@ -138,21 +233,360 @@ custom_add_condition: ConfigVar[AddFilterConditionFunc[Any]] = ConfigVar(
     default=_default_hook,
 )
 
+# how IN/NOT IN lists are compiled:
+# "in" - IN with one placeholder per value, "any" - = ANY/<> ALL with one array parameter (PostgreSQL),
+# "bucket" - IN with values padded to power-of-two size, so there are only few distinct statements
+InListStrategy: TypeAlias = Literal["in", "any", "bucket"]
+
+in_list_strategy: ConfigVar[InListStrategy] = ConfigVar(
+    "in_list_strategy",
+    default="in",
+)
+
+# IN/NOT IN lists longer than threshold are offloaded from per-value placeholders (see _LargeInList),
+# it keeps statements below driver parameter limits (asyncpg - 32767, SQLite - 999/32766, MSSQL - 2100),
+# None - lists are never offloaded
+in_list_offload_threshold: ConfigVar[int | None] = ConfigVar(
+    "in_list_offload_threshold",
+    default=None,
+)
+
+# like/ilike with anchored prefix pattern ("abc%") get additional range condition ("abc" <= col < "abd")
+# on PostgreSQL, compared with "C" collation to match (col COLLATE "C") index, original LIKE is kept to recheck rows,
+# ilike/not_ilike are compiled as LIKE over lower(col) so functional index on lower(col) can be used
+like_prefix_rewrite: ConfigVar[bool] = ConfigVar(
+    "like_prefix_rewrite",
+    default=False,
+)
+
+# counts of at least threshold rows are taken from EXPLAIN row estimate instead of count(*) (PostgreSQL)
+approximate_count_threshold: ConfigVar[int | None] = ConfigVar(
+    "approximate_count_threshold",
+    default=None,
+)
+
+# seconds to reuse counts of the same filtered statement and values, None - do not cache counts
+count_cache_ttl: ConfigVar[float | None] = ConfigVar(
+    "count_cache_ttl",
+    default=None,
+)
+
+# rows fetched from server-side cursor and sent to client at once by streaming helpers
+stream_chunk_size: ConfigVar[int] = ConfigVar(
+    "stream_chunk_size",
+    default=1_000,
+)
+
+# "ndjson" - one JSON object per line, "csv" - header row followed by values
+StreamFormat: TypeAlias = Literal["ndjson", "csv"]
+
+_STREAM_MEDIA_TYPES: Mapping[StreamFormat, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
 
 def generic_condition(left: Any, right: Any, op: AbstractFilterOperator) -> Any:
     return DEFAULT_FILTERS[op](left, right)
 
 
-def _apply_filter(
+# operators whose value is bound as parameter typed after the compared column,
+# it is faster than value coercion and keeps statement structure independent of values
+_BIND_OPERATORS: Container[AbstractFilterOperator] = frozenset(
+    {
+        FilterOperator.eq,
+        FilterOperator.ne,
+        FilterOperator.gt,
+        FilterOperator.ge,
+        FilterOperator.lt,
+        FilterOperator.le,
+        FilterOperator.like,
+        FilterOperator.not_like,
+        FilterOperator.ilike,
+        FilterOperator.not_ilike,
+    },
+)
+_EXPANDING_BIND_OPERATORS: Container[AbstractFilterOperator] = frozenset(
+    {
+        FilterOperator.in_,
+        FilterOperator.not_in,
+    },
+)
+_SQL_OPERATORS: Mapping[AbstractFilterOperator, OperatorType] = {
+    FilterOperator.eq: operators.eq,
+    FilterOperator.ne: operators.ne,
+    FilterOperator.gt: operators.gt,
+    FilterOperator.ge: operators.ge,
+    FilterOperator.lt: operators.lt,
+    FilterOperator.le: operators.le,
+    FilterOperator.like: operators.like_op,
+    FilterOperator.not_like: operators.like_op,
+    FilterOperator.ilike: operators.ilike_op,
+    FilterOperator.not_ilike: operators.ilike_op,
+    FilterOperator.in_: operators.in_op,
+    FilterOperator.not_in: operators.not_in_op,
+}
+
+
+def _get_column_type(column: Any) -> Any:
+    # untyped columns (e.g. raw sql without types) infer parameter type from value
+    type_ = getattr(column, "type", None)
+    return None if isinstance(type_, NullType) else type_
+
+
+def _get_compared_type(column: Any, op: AbstractFilterOperator, val: Any) -> Any:
+    if (type_ := _get_column_type(column)) is None:
+        return None
+
+    # same type as SQLAlchemy infers for "column <op> value", e.g. string compared with integer column
+    # or TypeDecorator.coerce_compared_value, expanding parameters are coerced by the first value
+    if op in _EXPANDING_BIND_OPERATORS:
+        val = next(iter(val), None)
+
+    return type_.coerce_compared_value(_SQL_OPERATORS[op], val)
+
+
+def _bind_param(
+    column: Any,
+    op: AbstractFilterOperator,
+    val: Any,
+    type_: Any = None,
+    *,
+    expanding: bool = False,
+) -> Any:
+    return bindparam(
+        getattr(column, "key", None),
+        val,
+        type_=type_ or _get_compared_type(column, op, val),
+        unique=True,
+        expanding=expanding,
+    )
+
+
+def _bind_value(column: Any, op: AbstractFilterOperator, val: Any) -> Any:
+    if op in _BIND_OPERATORS:
+        return _bind_param(column, op, val)
+    if op in _EXPANDING_BIND_OPERATORS:
+        return _bind_param(column, op, val, expanding=True)
+
+    return val
+
+
+def _pad_to_bucket(values: Any) -> list[Any]:
+    padded = [*values]
+    if padded:
+        # repeated values do not change IN result, but keep number of placeholders in few buckets
+        padded += [padded[-1]] * ((1 << (len(padded) - 1).bit_length()) - len(padded))
+
+    return padded
+
+
+class _LargeInList(ColumnElement[bool]):
+    __visit_name__ = "large_in_list"
+
+    inherit_cache = True
+    _is_implicitly_boolean = True
+    _traverse_internals = [  # noqa: RUF012
+        ("column", InternalTraversal.dp_clauseelement),
+        ("param", InternalTraversal.dp_clauseelement),
+        ("negate", InternalTraversal.dp_boolean),
+    ]
+
+    def __init__(self, column: Any, param: BindParameter[Any], *, negate: bool = False) -> None:
+        self.column = column
+        self.param = param
+        self.negate = negate
+        self.type = Boolean()
+
+
+@compiles(_LargeInList)
+def _compile_large_in_list(element: _LargeInList, compiler: SQLCompiler, **kw: Any) -> str:
+    # values are rendered inline at execution time, so there is no limit on number of parameters
+    param = element.param._clone()  # noqa: SLF001
+    param.literal_execute = True
+
+    condition = element.column.not_in(param) if element.negate else element.column.in_(param)
+    return compiler.process(condition, **kw)
+
+
+@compiles(_LargeInList, "postgresql")
+def _compile_large_in_list_postgresql(element: _LargeInList, compiler: SQLCompiler, **kw: Any) -> str:
+    # whole list is sent as single array parameter
+    param = element.param._clone()  # noqa: SLF001
+    param.expanding = False
+    if not isinstance(param.type, NullType):
+        param.type = ARRAY(param.type)
+
+    condition = element.column != all_(param) if element.negate else element.column == any_(param)
+    return compiler.process(condition, **kw)
+
+
+def _in_list_condition(column: Any, op: AbstractFilterOperator, val: Any, config: ConfigSnapshot) -> Any:
+    strategy = config[in_list_strategy]
+    threshold = config[in_list_offload_threshold]
+
+    if strategy != "any" and threshold is not None and len(val) > threshold:
+        param = _bind_param(column, op, [*val], expanding=True)
+        return _LargeInList(column, param, negate=op == FilterOperator.not_in)
+
+    if strategy == "any":
+        type_ = _get_compared_type(column, op, val)
+        param = _bind_param(column, op, [*val], ARRAY(type_) if type_ is not None else None)
+        return column == any_(param) if op == FilterOperator.in_ else column != all_(param)
+
+    if strategy == "bucket":
+        val = _pad_to_bucket(val)
+
+    return DEFAULT_FILTERS[op](column, _bind_value(column, op, val))
+
+
+_LIKE_OPERATORS: Container[AbstractFilterOperator] = frozenset(
+    {
+        FilterOperator.like,
+        FilterOperator.ilike,
+        FilterOperator.not_ilike,
+    },
+)
+_LOWER_LIKE_OPERATORS: Mapping[AbstractFilterOperator, AbstractFilterOperator] = {
+    FilterOperator.ilike: FilterOperator.like,
+    FilterOperator.not_ilike: FilterOperator.not_like,
+}
+
+
+def _get_like_prefix(pattern: str) -> str | None:
+    # backslash is default escape character of LIKE in PostgreSQL and MySQL
+    prefix: list[str] = []
+    escaped = False
+
+    for pos, char in enumerate(pattern):
+        if escaped:
+            prefix.append(char)
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char == "%" and pos == len(pattern) - 1:
+            return "".join(prefix) or None
+        elif char in "%_":
+            return None
+        else:
+            prefix.append(char)
+
+    return None
+
+
+def _get_prefix_upper_bound(prefix: str) -> str | None:
+    while prefix:
+        code = ord(prefix[-1]) + 1
+
+        if code <= sys.maxunicode:
+            # surrogates can not be encoded, next character after them is U+E000
+            return prefix[:-1] + chr(0xE000 if 0xD800 <= code <= 0xDFFF else code)  # noqa: PLR2004
+
+        prefix = prefix[:-1]
+
+    return None
+
+
+class _PrefixLike(ColumnElement[bool]):
+    __visit_name__ = "prefix_like"
+
+    inherit_cache = True
+    _is_implicitly_boolean = True
+    _traverse_internals = [  # noqa: RUF012
+        ("column", InternalTraversal.dp_clauseelement),
+        ("condition", InternalTraversal.dp_clauseelement),
+        ("lower", InternalTraversal.dp_clauseelement),
+        ("upper", InternalTraversal.dp_clauseelement),
+    ]
+
+    def __init__(self, column: Any, condition: Any, lower: BindParameter[Any], upper: BindParameter[Any]) -> None:
+        self.column = column
+        self.condition = condition
+        self.lower = lower
+        self.upper = upper
+        self.type = Boolean()
+
+
+@compiles(_PrefixLike)
+def _compile_prefix_like(element: _PrefixLike, compiler: SQLCompiler, **kw: Any) -> str:
+    # LIKE is case-insensitive in SQLite and MySQL (with default collations), range would lose rows there
+    return compiler.process(element.condition, **kw)
+
+
+@compiles(_PrefixLike, "postgresql")
+def _compile_prefix_like_postgresql(element: _PrefixLike, compiler: SQLCompiler, **kw: Any) -> str:
+    # bounds are computed by code points, under other collations range would lose rows
+    column = collate(element.column, "C")
+    return compiler.process(and_(column >= element.lower, column < element.upper, element.condition), **kw)
+
+
+def _like_condition(column: Any, op: AbstractFilterOperator, val: str) -> Any:
+    if op in _LOWER_LIKE_OPERATORS:
+        column, op, val = func.lower(column), _LOWER_LIKE_OPERATORS[op], val.lower()
+
+    cond = DEFAULT_FILTERS[op](column, _bind_value(column, op, val))
+
+    if (
+        op == FilterOperator.like
+        and (prefix := _get_like_prefix(val)) is not None
+        and (upper := _get_prefix_upper_bound(prefix)) is not None
+    ):
+        return _PrefixLike(
+            column,
+            cond,
+            _bind_param(column, FilterOperator.ge, prefix),
+            _bind_param(column, FilterOperator.lt, upper),
+        )
+
+    return cond
+
+
+def _generic_condition(column: Any, op: AbstractFilterOperator, val: Any, config: ConfigSnapshot) -> Any:
+    if op in _EXPANDING_BIND_OPERATORS:
+        return _in_list_condition(column, op, val, config)
+    if op in _LIKE_OPERATORS and isinstance(val, str) and config[like_prefix_rewrite]:
+        return _like_condition(column, op, val)
+
+    return DEFAULT_FILTERS[op](column, _bind_value(column, op, val))
+
+
+FilterShape: TypeAlias = tuple[tuple[str, AbstractFilterOperator, Hashable], ...]
+
+
+def _get_value_kind(val: Any) -> Hashable:
+    if isinstance(val, list | tuple | set | frozenset):
+        return "seq", 1 << max(len(val) - 1, 0).bit_length()
+
+    return cast(Hashable, type(val))
+
+
+def get_filters_shape(filters: FilterValues) -> FilterShape:
+    return tuple(
+        (field, op, _get_value_kind(val))
+        for field, field_filters in filters.items()
+        for op, val in field_filters.items()
+    )
+
+
+# resolved columns per (statement, namespace, filters shape), used when no apply_filter hooks are set
+_filters_shape_cache: LRUCache[Hashable, tuple[Any, ...]] = LRUCache(maxsize=1024)
+
+
+def filters_shape_cache_stats() -> CacheStats:
+    return _filters_shape_cache.stats()
+
+
+def _get_condition(
     stmt: TSelectable,
     ns: EntityNamespace,
     field: str,
     op: AbstractFilterOperator,
     val: Any,
-    apply_filter: ApplyFilterFunc[TSelectable] | None = None,
-    add_condition: AddFilterConditionFunc[TSelectable] | None = None,
-) -> TSelectable:
-    custom_apply_filter_impl = custom_apply_filter.get()
+    *,
+    apply_filter: ApplyFilterFunc[TSelectable] | None,
+    config: ConfigSnapshot,
+) -> tuple[Any, "_RelationshipPath | None"]:
+    custom_apply_filter_impl = config[custom_apply_filter]
 
     try:
         cond = None
@@ -167,21 +601,34 @@ def _apply_filter(
             cond = custom_apply_filter_impl(stmt, ns, field, op, val)
             assert cond is not None
     except (NotImplementedError, AssertionError):
-        if field not in ns:
-            raise ValueError(f"Unknown field {field}") from None
+        column = _resolve_field(stmt, ns, field)
+
+        path = None
+        if isinstance(column, _RelationshipPath):
+            path, column = column, column.column
 
         try:
-            cond = generic_condition(ns[field], val, op)
+            return _generic_condition(column, op, val, config), path
         except KeyError:
             raise NotImplementedError(f"Operator {op} is not implemented") from None
 
+    return cond, None
+
+
+def _add_condition(
+    stmt: TSelectable,
+    field: str,
+    cond: Any,
+    add_condition: AddFilterConditionFunc[TSelectable] | None,
+    config: ConfigSnapshot,
+) -> TSelectable | None:
     if add_condition:
         try:
             return add_condition(stmt, field, cond)
         except NotImplementedError:
             pass
 
-    global_add_condition = custom_add_condition.get()
+    global_add_condition = config[custom_add_condition]
 
     try:
         res = global_add_condition(stmt, field, cond)
@@ -189,9 +636,268 @@ def _apply_filter(
 
         return cast(TSelectable, res)
     except (NotImplementedError, AssertionError):
-        pass
+        return None
+
+
+def _get_expr_cache_key(expr: Any) -> Hashable | None:
+    with suppress(AttributeError):
+        expr = expr.__clause_element__()
+
+    try:
+        cache_key = expr._generate_cache_key()  # noqa: SLF001
+    except AttributeError:
+        return None
+
+    return None if cache_key is None else cache_key.key
+
+
+def _get_filters_shape_key(
+    stmt: Select[Any],
+    filters: FilterValues,
+    remapping: Mapping[str, str],
+    additional: AdditionalNamespace | None,
+) -> Hashable | None:
+    if (stmt_key := _get_stmt_cache_key(stmt)) is None:
+        return None
+
+    additional_keys = []
+    for key, expr in (additional or {}).items():
+        if (expr_key := _get_expr_cache_key(expr)) is None:
+            return None
+
+        additional_keys.append((key.name if isinstance(key, FilterField) else key, expr_key))
+
+    return stmt_key, tuple(additional_keys), tuple(remapping.items()), get_filters_shape(filters)
+
+
+@dataclass(eq=False, frozen=True)
+class _RelationshipPath:
+    # many-to-one prefix of path, outer joined to aliased targets: alias -> relationship attribute
+    joins: Mapping[Any, Any]
+    # relationships starting from first one-to-many one, compiled to nested correlated EXISTS
+    exists: tuple[Any, ...]
+    column: Any
+
+    def condition(self, cond: Any) -> Any:
+        for rel in reversed(self.exists):
+            cond = rel.any(cond) if rel.property.uselist else rel.has(cond)
+
+        return cond
+
+
+_relationship_paths_cache: LRUCache[Hashable, _RelationshipPath] = LRUCache(maxsize=1024)
+
+# alias per (root entity, relationships path), so all fields of the same related entity share one join
+_relationship_aliases_cache: LRUCache[Hashable, Any] = LRUCache(maxsize=1024)
+
+
+def _split_path(field: str) -> tuple[str, ...] | None:
+    parts = tuple(field.replace(".", "__").split("__"))
+    return parts if len(parts) > 1 and all(parts) else None
+
+
+def _get_root_entity(stmt: Select[Any]) -> Any | None:
+    for description in stmt.column_descriptions:
+        if (entity := description.get("entity")) is not None:
+            return entity
+
+    return None
+
+
+def _build_relationship_path(entity: Any, path: Sequence[str]) -> _RelationshipPath | None:
+    joins: dict[Any, Any] = {}
+    exists: list[Any] = []
+
+    current = entity
+    for pos, name in enumerate(path[:-1], 1):
+        if (rel := inspect(current).mapper.relationships.get(name)) is None:
+            return None
+
+        attr = getattr(current, name)
+        if exists or rel.uselist:
+            # one-to-many joins would duplicate rows
+            exists.append(attr)
+            current = rel.mapper.class_
+        else:
+            current = _relationship_aliases_cache.get_or_create(
+                (entity, path[:pos]), partial(aliased, rel.mapper.class_)
+            )
+            joins[current] = attr
+
+    if path[-1] not in inspect(current).mapper.column_attrs:
+        return None
+
+    return _RelationshipPath(joins=joins, exists=tuple(exists), column=getattr(current, path[-1]))
+
+
+def _get_entity_relationship_path(entity: Any, path: tuple[str, ...]) -> _RelationshipPath | None:
+    key = entity, path
+    if (res := _relationship_paths_cache.get(key)) is None and (res := _build_relationship_path(entity, path)):
+        _relationship_paths_cache.set(key, res)
+
+    return res
+
+
+def _get_relationship_path(stmt: Select[Any], field: str) -> _RelationshipPath | None:
+    if (path := _split_path(field)) is None or (entity := _get_root_entity(stmt)) is None:
+        return None
+
+    return _get_entity_relationship_path(entity, path)
+
+
+def _resolve_field(stmt: Select[Any], ns: EntityNamespace, field: str) -> Any:
+    if field in ns:
+        return ns[field]
+
+    if (path := _get_relationship_path(stmt, field)) is None:
+        raise ValueError(f"Unknown field {field}")
+
+    return path
+
 
-    return stmt.where(cond)  # type: ignore[arg-type]
+def _join_relationship_paths(stmt: TSelectable, paths: Sequence[_RelationshipPath]) -> TSelectable:
+    joined = {*find_tables(stmt, include_aliases=True)}
+
+    for path in paths:
+        for alias, attr in path.joins.items():
+            if (selectable := inspect(alias).selectable) not in joined:
+                stmt = stmt.outerjoin(attr.of_type(alias))
+                joined.add(selectable)
+
+    return stmt
+
+
+def _resolve_filters_columns(
+    stmt: Select[Any],
+    ns: EntityNamespace,
+    filters: FilterValues,
+    remapping: Mapping[str, str],
+) -> tuple[Any, ...]:
+    columns = []
+    for field, field_filters in filters.items():
+        column = _resolve_field(stmt, ns, remapping.get(field, field))
+
+        for op in field_filters:
+            if op not in DEFAULT_FILTERS:
+                raise NotImplementedError(f"Operator {op} is not implemented")
+
+            columns.append(column)
+
+    return tuple(columns)
+
+
+def _get_filters_columns(
+    stmt: Select[Any],
+    ns: EntityNamespace,
+    filters: FilterValues,
+    remapping: Mapping[str, str],
+    additional: AdditionalNamespace | None,
+) -> tuple[Any, ...]:
+    if (key := _get_filters_shape_key(stmt, filters, remapping, additional)) is None:
+        return _resolve_filters_columns(stmt, ns, filters, remapping)
+
+    return _filters_shape_cache.get_or_create(key, lambda: _resolve_filters_columns(stmt, ns, filters, remapping))
+
+
+def _get_field_conditions(
+    stmt: TSelectable,
+    ns: EntityNamespace,
+    field: str,
+    field_filters: Mapping[AbstractFilterOperator, Any],
+    *,
+    columns: Iterator[Any] | None,
+    apply_filter: ApplyFilterFunc[TSelectable] | None,
+    config: ConfigSnapshot,
+) -> tuple[list[Any], list[_RelationshipPath]]:
+    conds = []
+    paths: dict[_RelationshipPath, list[Any]] = {}
+
+    for op, val in field_filters.items():
+        if columns is not None:
+            column = path = next(columns)
+
+            if isinstance(path, _RelationshipPath):
+                column = path.column
+            else:
+                path = None
+
+            cond = _generic_condition(column, op, val, config)
+        else:
+            cond, path = _get_condition(stmt, ns, field, op, val, apply_filter=apply_filter, config=config)
+
+        if path is None:
+            conds.append(cond)
+        else:
+            paths.setdefault(path, []).append(cond)
+
+    # all conditions of relationship path field are checked against the same related row
+    conds.extend(path.condition(and_(*path_conds)) for path, path_conds in paths.items())
+
+    return conds, [*paths]
+
+
+def _apply_filters(
+    stmt: TSelectable,
+    ns: EntityNamespace,
+    filters: FilterValues,
+    *,
+    remapping: Mapping[str, str],
+    additional: AdditionalNamespace | None,
+    apply_filter: ApplyFilterFunc[TSelectable] | None,
+    add_condition: AddFilterConditionFunc[TSelectable] | None,
+    config: ConfigSnapshot,
+) -> tuple[TSelectable, bool]:
+    if config[filters_simplification_config]:
+        if (simplified := simplify_filters(filters, sql_nulls=True)) is None:
+            return stmt.where(false()), False
+
+        filters = simplified
+
+    # without apply_filter hooks conditions depend only on filters shape,
+    # so columns are resolved once per shape and values are bound as parameters
+    columns = None
+    if apply_filter is None and config[custom_apply_filter] is _default_hook:
+        columns = iter(_get_filters_columns(stmt, ns, filters, remapping, additional))
+
+    # conditions not handled by add_condition hooks are attached at once,
+    # as every Select.where call creates a new copy of the statement
+    conds: list[Any] = []
+    hooked = False
+    has_hooks = add_condition is not None or config[custom_add_condition] is not _default_hook
+    joins: list[_RelationshipPath] = []
+    for field, field_filters in filters.items():
+        field = remapping.get(field, field)
+
+        field_conds, paths = _get_field_conditions(
+            stmt,
+            ns,
+            field,
+            field_filters,
+            columns=columns,
+            apply_filter=apply_filter,
+            config=config,
+        )
+        joins.extend(paths)
+
+        for cond in field_conds:
+            # hooks get statement with all preceding conditions attached
+            if has_hooks and conds:
+                stmt = stmt.where(*conds)
+                conds = []
+
+            if (res := _add_condition(stmt, field, cond, add_condition, config)) is not None:
+                stmt = res
+                hooked = True
+            else:
+                conds.append(cond)
+
+    if joins:
+        stmt = _join_relationship_paths(stmt, joins)
+
+    if conds:
+        stmt = stmt.where(*conds)
+
+    return stmt, hooked
 
 
 def apply_filters(
@@ -202,38 +908,30 @@ def apply_filters(
     additional: AdditionalNamespace | None = None,
     apply_filter: ApplyFilterFunc[TSelectable] | None = None,
     add_condition: AddFilterConditionFunc[TSelectable] | None = None,
+    config: ConfigSnapshot | None = None,
 ) -> TSelectable:
     if isinstance(filters, FilterSet):
         filters = filters.filter_values
 
-    remapping = remapping or {}
-    ns = {
-        **_get_entity_namespace(stmt),
-        **_normalize_additional_namespace(additional or {}),
-    }
-
-    for field, field_filters in filters.items():
-        field = remapping.get(field, field)
-
-        for op, val in field_filters.items():
-            stmt = _apply_filter(stmt, ns, field, op, val, apply_filter, add_condition)
-
+    stmt, _ = _apply_filters(
+        stmt,
+        _get_namespace(stmt, additional),
+        filters,
+        remapping=remapping or {},
+        additional=additional,
+        apply_filter=apply_filter,
+        add_condition=add_condition,
+        config=config or ConfigSnapshot.capture(),
+    )
     return stmt
 
 
-def apply_sorting(
+def _apply_sorting(
     stmt: TSelectable,
+    ns: EntityNamespace,
     sorting: SortingValues,
-    *,
-    remapping: Mapping[str, str] | None = None,
-    additional: AdditionalNamespace | None = None,
+    remapping: Mapping[str, str],
 ) -> TSelectable:
-    remapping = remapping or {}
-    ns = {
-        **_get_entity_namespace(stmt),
-        **_normalize_additional_namespace(additional or {}),
-    }
-
     for field, direction, nulls in sorting:
         field = remapping.get(field, field)
 
@@ -250,6 +948,16 @@ def apply_sorting(
     return stmt
 
 
+def apply_sorting(
+    stmt: TSelectable,
+    sorting: SortingValues,
+    *,
+    remapping: Mapping[str, str] | None = None,
+    additional: AdditionalNamespace | None = None,
+) -> TSelectable:
+    return _apply_sorting(stmt, _get_namespace(stmt, additional), sorting, remapping or {})
+
+
 def apply_filters_and_sorting(
     stmt: TSelectable,
     filters: FilterValues | FilterSet,
@@ -259,7 +967,59 @@ def apply_filters_and_sorting(
     additional: AdditionalNamespace | None = None,
     apply_filter: ApplyFilterFunc[TSelectable] | None = None,
     add_condition: AddFilterConditionFunc[TSelectable] | None = None,
+    config: ConfigSnapshot | None = None,
 ) -> TSelectable:
+    if isinstance(filters, FilterSet):
+        filters = filters.filter_values
+
+    remapping = remapping or {}
+    ns = _get_namespace(stmt, additional)
+
+    stmt, hooked = _apply_filters(
+        stmt,
+        ns,
+        filters,
+        remapping=remapping,
+        additional=additional,
+        apply_filter=apply_filter,
+        add_condition=add_condition,
+        config=config or ConfigSnapshot.capture(),
+    )
+
+    # add_condition hooks are allowed to change FROM list (e.g. add joins)
+    if hooked:
+        ns = _get_namespace(stmt, additional)
+
+    return _apply_sorting(stmt, ns, sorting, remapping)
+
+
+def _is_grouped(stmt: Select[Any]) -> bool:
+    return bool(stmt._distinct or stmt._group_by_clauses or stmt._having_criteria)  # noqa: SLF001
+
+
+def build_count_statement(stmt: Select[Any]) -> Select[tuple[int]]:
+    # total count does not depend on page ordering and bounds
+    stmt = stmt.order_by(None).limit(None).offset(None).fetch(None)
+
+    # rows of grouped statements exist only after selected columns are evaluated
+    if _is_grouped(stmt):
+        return select(func.count()).select_from(stmt.subquery())
+
+    # selected columns (with their correlated subqueries and eager loads) are dropped,
+    # FROM list is kept as is, as joins can change number of rows
+    return cast(Select[tuple[int]], stmt.with_only_columns(func.count(), maintain_column_froms=True))
+
+
+def apply_filters_count(
+    stmt: Select[Any],
+    filters: FilterValues | FilterSet,
+    *,
+    remapping: Mapping[str, str] | None = None,
+    additional: AdditionalNamespace | None = None,
+    apply_filter: ApplyFilterFunc[Select[Any]] | None = None,
+    add_condition: AddFilterConditionFunc[Select[Any]] | None = None,
+    config: ConfigSnapshot | None = None,
+) -> Select[tuple[int]]:
     stmt = apply_filters(
         stmt,
         filters,
@@ -267,14 +1027,395 @@ def apply_filters_and_sorting(
         additional=additional,
         apply_filter=apply_filter,
         add_condition=add_condition,
+        config=config,
     )
-    return apply_sorting(
+    return build_count_statement(stmt)
+
+
+@dataclass(frozen=True)
+class PageAndCount(Generic[T]):
+    items: Sequence[T]
+    total: int
+
+
+async def _fetch_items(session_factory: Callable[[], "AsyncSession"], stmt: Select[tuple[T]]) -> Sequence[T]:
+    async with session_factory() as session:
+        return (await session.scalars(stmt)).all()
+
+
+async def _fetch_count(session_factory: Callable[[], "AsyncSession"], stmt: Select[tuple[int]]) -> int:
+    async with session_factory() as session:
+        return (await session.scalar(stmt)) or 0
+
+
+async def fetch_page_and_count(
+    session_factory: Callable[[], "AsyncSession"],
+    stmt: Select[tuple[T]],
+    *,
+    limit: int,
+    offset: int = 0,
+    skip_count_for_short_page: bool = False,
+) -> PageAndCount[T]:
+    page_stmt = stmt.limit(limit).offset(offset)
+    count_stmt = build_count_statement(stmt)
+
+    # session is bound to a single connection, so each query gets own session (and pooled connection)
+    if not skip_count_for_short_page:
+        items, total = await asyncio.gather(
+            _fetch_items(session_factory, page_stmt),
+            _fetch_count(session_factory, count_stmt),
+        )
+        return PageAndCount(items=items, total=total)
+
+    items = await _fetch_items(session_factory, page_stmt)
+
+    # short page is the last one, unless offset is past the end
+    if len(items) < limit and (items or not offset):
+        return PageAndCount(items=items, total=offset + len(items))
+
+    return PageAndCount(items=items, total=await _fetch_count(session_factory, count_stmt))
+
+
+@dataclass(frozen=True)
+class FilteredCount:
+    total: int
+    exact: bool
+
+
+class _Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, stmt: Select[Any]) -> None:
+        self.stmt = stmt
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain_postgresql(element: _Explain, compiler: SQLCompiler, **kw: Any) -> str:
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.stmt, **kw)}"
+
+
+_counts_cache: TTLCache[Hashable, FilteredCount] = TTLCache(maxsize=1024)
+
+
+def counts_cache_stats() -> CacheStats:
+    return _counts_cache.stats()
+
+
+def _canonical_filters(filters: FilterValues) -> FilterValues:
+    # same filters passed in different order produce the same statement
+    return {field: dict(sorted(filters[field].items(), key=lambda item: str(item[0]))) for field in sorted(filters)}
+
+
+def _get_count_cache_key(bind: Any, stmt: Select[Any]) -> Hashable | None:
+    if (cache_key := stmt._generate_cache_key()) is None:  # noqa: SLF001
+        return None
+
+    try:
+        return bind, cache_key.key, freeze([param.effective_value for param in cache_key.bindparams])
+    except TypeError:  # unhashable values
+        return None
+
+
+def _get_rows_statement(stmt: Select[Any]) -> Select[Any]:
+    stmt = stmt.order_by(None).limit(None).offset(None).fetch(None)
+    if _is_grouped(stmt):
+        return stmt
+
+    return stmt.with_only_columns(literal_column("1"), maintain_column_froms=True)
+
+
+async def _estimate_count(session: "AsyncSession", stmt: Select[Any]) -> int:
+    plan = await session.scalar(_Explain(_get_rows_statement(stmt)))
+
+    # asyncpg returns json as is, psycopg decodes it
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def _fetch_filtered_count(session: "AsyncSession", stmt: Select[Any], config: ConfigSnapshot) -> FilteredCount:
+    threshold = config[approximate_count_threshold]
+
+    # estimates of small results are too inaccurate, and counting them is cheap anyway
+    if threshold is not None and session.get_bind().dialect.name == "postgresql":
+        estimate = await _estimate_count(session, stmt)
+
+        if estimate >= threshold:
+            return FilteredCount(total=estimate, exact=False)
+
+    return FilteredCount(total=(await session.scalar(build_count_statement(stmt))) or 0, exact=True)
+
+
+async def fetch_count(
+    session: "AsyncSession",
+    stmt: Select[Any],
+    filters: FilterValues | FilterSet,
+    *,
+    remapping: Mapping[str, str] | None = None,
+    additional: AdditionalNamespace | None = None,
+    apply_filter: ApplyFilterFunc[Select[Any]] | None = None,
+    add_condition: AddFilterConditionFunc[Select[Any]] | None = None,
+    config: ConfigSnapshot | None = None,
+) -> FilteredCount:
+    if isinstance(filters, FilterSet):
+        filters = filters.filter_values
+
+    config = config or ConfigSnapshot.capture()
+    stmt = apply_filters(
+        stmt,
+        _canonical_filters(filters),
+        remapping=remapping,
+        additional=additional,
+        apply_filter=apply_filter,
+        add_condition=add_condition,
+        config=config,
+    )
+
+    if (ttl := config[count_cache_ttl]) is None:
+        return await _fetch_filtered_count(session, stmt, config)
+
+    # filtered statement structure and bound values identify filters shape and values
+    if (key := _get_count_cache_key(session.get_bind(), stmt)) is None:
+        return await _fetch_filtered_count(session, stmt, config)
+
+    if (count := _counts_cache.get(key)) is None:
+        count = _counts_cache.set(key, await _fetch_filtered_count(session, stmt, config), ttl=ttl)
+
+    return count
+
+
+def _is_entity_statement(stmt: Select[Any]) -> bool:
+    match stmt.column_descriptions:
+        case [{"entity": entity, "expr": expr}] if entity is not None and expr is entity:
+            return True
+
+    return False
+
+
+def _entity_to_dict(entity: Any) -> dict[str, Any]:
+    return {column.name: getattr(entity, column.name) for column in _get_orm_columns(type(entity)).columns}
+
+
+def stream_rows(
+    session_factory: Callable[[], "AsyncSession"],
+    stmt: Select[Any],
+    *,
+    chunk_size: int | None = None,
+    config: ConfigSnapshot | None = None,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    # resolved before iteration starts, as generator body runs outside of caller context
+    if chunk_size is None:
+        chunk_size = config[stream_chunk_size] if config is not None else stream_chunk_size.get()
+
+    return _stream_rows(session_factory, stmt, chunk_size)
+
+
+async def _stream_rows(
+    session_factory: Callable[[], "AsyncSession"],
+    stmt: Select[Any],
+    chunk_size: int,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    # server-side cursor, next chunk is fetched only after previous one is consumed
+    stmt = stmt.execution_options(yield_per=chunk_size)
+
+    async with session_factory() as session:
+        result = await session.stream(stmt)
+
+        if _is_entity_statement(stmt):
+            async for entities in result.scalars().partitions(chunk_size):
+                yield [_entity_to_dict(entity) for entity in entities]
+        else:
+            async for rows in result.mappings().partitions(chunk_size):
+                yield [dict(row) for row in rows]
+
+
+async def _encode_ndjson(chunks: AsyncIterator[list[dict[str, Any]]]) -> AsyncIterator[bytes]:
+    async for rows in chunks:
+        yield b"".join([to_json(row) + b"\n" for row in rows])
+
+
+async def _encode_csv(chunks: AsyncIterator[list[dict[str, Any]]]) -> AsyncIterator[str]:
+    header = True
+
+    async for rows in chunks:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        if header:
+            writer.writerow(rows[0].keys())
+            header = False
+
+        writer.writerows(row.values() for row in rows)
+        yield buffer.getvalue()
+
+
+def create_streaming_response(
+    session_factory: Callable[[], "AsyncSession"],
+    stmt: Select[Any],
+    filters: FilterValues | FilterSet,
+    sorting: SortingValues,
+    *,
+    format: StreamFormat = "ndjson",  # noqa: A002
+    chunk_size: int | None = None,
+    remapping: Mapping[str, str] | None = None,
+    additional: AdditionalNamespace | None = None,
+    apply_filter: ApplyFilterFunc[Select[Any]] | None = None,
+    add_condition: AddFilterConditionFunc[Select[Any]] | None = None,
+    config: ConfigSnapshot | None = None,
+) -> StreamingResponse:
+    stmt = apply_filters_and_sorting(
         stmt,
+        filters,
         sorting,
         remapping=remapping,
         additional=additional,
+        apply_filter=apply_filter,
+        add_condition=add_condition,
+        config=config,
     )
 
+    # session is owned by the stream, as request scoped sessions can be closed before response is sent
+    chunks = stream_rows(session_factory, stmt, chunk_size=chunk_size, config=config)
+    content = _encode_csv(chunks) if format == "csv" else _encode_ndjson(chunks)
+
+    return StreamingResponse(content, media_type=_STREAM_MEDIA_TYPES[format])
+
+
+def _get_primary_key(stmt: Select[Any]) -> list[str]:
+    for description in stmt.column_descriptions:
+        if (entity := description.get("entity")) is not None:
+            mapper = inspect(entity).mapper
+            return [mapper.get_property_by_column(column).key for column in mapper.primary_key]
+
+    for from_ in stmt.get_final_froms():
+        if primary_key := getattr(from_, "primary_key", None):
+            return [column.name for column in primary_key]
+
+    raise ValueError("Unable to detect primary key, pass tie_breaker explicitly")
+
+
+def _get_keyset_sorting(
+    stmt: Select[Any],
+    sorting: SortingValues,
+    tie_breaker: Sequence[str] | None = None,
+    remapping: Mapping[str, str] | None = None,
+) -> SortingValues:
+    remapping = remapping or {}
+    sorting = [(remapping.get(field, field), direction, nulls) for field, direction, nulls in sorting]
+
+    if tie_breaker is None:
+        tie_breaker = _get_primary_key(stmt)
+
+    # tie-breaker follows the last direction, so single-direction sorting can use row-value comparison
+    direction: SortingDirection = sorting[-1][1] if sorting else "asc"
+    fields = {field for field, *_ in sorting}
+
+    return [*sorting, *((field, direction, None) for field in tie_breaker if field not in fields)]
+
+
+@cache
+def _get_type_adapter(tp: type[Any]) -> TypeAdapter[Any]:
+    return TypeAdapter(tp)
+
+
+def _invalid_cursor_error(cursor: CursorValues, msg: str) -> RequestValidationError:
+    return RequestValidationError([{"type": "value_error", "loc": ("query", "cursor"), "msg": msg, "input": cursor}])
+
+
+def _coerce_cursor_value(column: Any, value: Any, idx: int) -> Any:
+    if value is None:
+        return None
+
+    try:
+        python_type = column.type.python_type
+    except (AttributeError, NotImplementedError):
+        return value
+
+    try:
+        return _get_type_adapter(python_type).validate_python(value)
+    except ValidationError as exc:
+        errors = [{**err, "loc": ("query", "cursor", idx, *err["loc"])} for err in exc.errors(include_url=False)]
+        raise RequestValidationError(errors) from None
+
+
+def _check_keyset_nulls(columns: Sequence[Any], sorting: SortingValues) -> None:
+    for column, (field, _, nulls) in zip(columns, sorting, strict=True):
+        # NULLs position without NULLS FIRST/LAST depends on database, so it can not be used in keyset condition
+        if nulls is None and getattr(column, "nullable", False):
+            raise ValueError(f"Nullable field {field!r} requires explicit nulls position for keyset pagination")
+
+
+def _keyset_after(column: Any, direction: SortingDirection, nulls: SortingNulls, value: Any) -> Any:
+    nulls_first_in_order = (direction, nulls) in {("asc", "smaller"), ("desc", "bigger")}
+
+    if value is None:
+        return column.isnot(None) if nulls_first_in_order else false()
+
+    cond = column > value if direction == "asc" else column < value
+    if nulls is not None and not nulls_first_in_order:
+        cond = or_(cond, column.is_(None))
+
+    return cond
+
+
+def _keyset_condition(columns: Sequence[Any], sorting: SortingValues, values: Sequence[Any]) -> Any:
+    directions = {direction for _, direction, _ in sorting}
+
+    # fields without explicit nulls ordering are expected to be NOT NULL
+    if len(directions) == 1 and all(nulls is None for *_, nulls in sorting) and None not in values:
+        left, right = tuple_(*columns), tuple_(*values)
+        return left > right if directions == {"asc"} else left < right
+
+    conds = []
+    for i, (column, (_, direction, nulls), value) in enumerate(zip(columns, sorting, values, strict=True)):
+        eqs = [col.is_(None) if val is None else col == val for col, val in zip(columns[:i], values[:i], strict=True)]
+        conds.append(and_(*eqs, _keyset_after(column, direction, nulls, value)))
+
+    return or_(*conds)
+
+
+def apply_keyset(
+    stmt: TSelectable,
+    sorting: SortingValues,
+    cursor: CursorValues | None,
+    *,
+    tie_breaker: Sequence[str] | None = None,
+    remapping: Mapping[str, str] | None = None,
+    additional: AdditionalNamespace | None = None,
+) -> TSelectable:
+    sorting = _get_keyset_sorting(stmt, sorting, tie_breaker, remapping)
+    ns = _get_namespace(stmt, additional)
+    stmt = _apply_sorting(stmt, ns, sorting, {})
+
+    columns = [ns[field] for field, *_ in sorting]
+    _check_keyset_nulls(columns, sorting)
+
+    if cursor is None:
+        return stmt
+
+    # cursor comes from client, so mismatches are reported as validation errors
+    if len(cursor) != len(sorting):
+        raise _invalid_cursor_error(cursor, "Cursor does not match sorting")
+
+    values = [
+        _coerce_cursor_value(column, value, i) for i, (column, value) in enumerate(zip(columns, cursor, strict=True))
+    ]
+
+    return stmt.where(_keyset_condition(columns, sorting, values))
+
+
+def create_keyset_cursor(
+    row: Any,
+    stmt: Select[Any],
+    sorting: SortingValues,
+    *,
+    tie_breaker: Sequence[str] | None = None,
+    remapping: Mapping[str, str] | None = None,
+) -> str:
+    sorting = _get_keyset_sorting(stmt, sorting, tie_breaker, remapping)
+    return encode_cursor([getattr(row, field) for field, *_ in sorting])
+
 
 def adapt_sqlalchemy_column_type(column: ColumnProperty[Any]) -> FilterFieldDef:
     expr: Any = column.expression
@@ -288,6 +1429,62 @@ def adapt_sqlalchemy_column_type(column: ColumnProperty[Any]) -> FilterFieldDef:
     return cast(FilterFieldDef, type_)
 
 
+@dataclass(frozen=True)
+class _ORMColumn:
+    name: str
+    column: ColumnProperty[Any]
+    is_fk: bool
+
+
+@dataclass(frozen=True)
+class _ORMColumns:
+    names: tuple[str, ...]
+    columns: tuple[_ORMColumn, ...]
+
+
+# inspection results shared by filters and sorting factories, per mapper (or aliased class)
+_orm_columns_cache: LRUCache[Hashable, _ORMColumns] = LRUCache(maxsize=1024)
+# only types are cached, operators of filter fields depend on config and are resolved per call
+_orm_column_types_cache: LRUCache[_ORMColumn, FilterFieldDef] = LRUCache(maxsize=None)
+
+
+def orm_columns_cache_stats() -> CacheStats:
+    return _orm_columns_cache.stats()
+
+
+@event.listens_for(Mapper, "after_configured")
+def _clear_orm_columns_cache() -> None:
+    # new mappers or relationships change mapper.attrs
+    _orm_columns_cache.clear()
+    _orm_column_types_cache.clear()
+
+
+def _inspect_orm_columns(inspected: Any) -> _ORMColumns:
+    attrs = inspected.mapper.attrs
+
+    return _ORMColumns(
+        names=tuple(attrs.keys()),
+        columns=tuple(
+            _ORMColumn(
+                name=name,
+                column=column,
+                is_fk=bool(getattr(column.expression, "foreign_keys", None)),
+            )
+            for name, column in attrs.items()
+            if isinstance(column, ColumnProperty)
+        ),
+    )
+
+
+def _get_orm_column_type(column: _ORMColumn) -> FilterFieldDef:
+    return _orm_column_types_cache.get_or_create(column, lambda: adapt_sqlalchemy_column_type(column.column))
+
+
+def _get_orm_columns(obj: Any) -> _ORMColumns:
+    inspected = inspect(obj, raiseerr=True)
+    return _orm_columns_cache.get_or_create(inspected, lambda: _inspect_orm_columns(inspected))
+
+
 def _iter_over_orm_columns(
     obj: Any,
     *,
@@ -295,25 +1492,41 @@ def _iter_over_orm_columns(
     include: Container[str] | None = None,
     exclude: Container[str] | None = None,
     remapping: Mapping[str, str] | None = None,
-) -> Iterator[tuple[str, ColumnProperty[Any]]]:
-    inspected = inspect(obj, raiseerr=True)
+) -> Iterator[tuple[str, _ORMColumn]]:
+    orm_columns = _get_orm_columns(obj)
 
     remapping = remapping or {}
-    checker = fields_include_exclude(inspected.mapper.attrs.keys(), include, exclude)
+    checker = fields_include_exclude(orm_columns.names, include, exclude)
 
-    for name, column in inspected.mapper.attrs.items():
-        name = remapping.get(name, name)
+    for column in orm_columns.columns:
+        name = remapping.get(column.name, column.name)
 
         if not checker(name):
             continue
 
-        if not isinstance(column, ColumnProperty):
+        if not include_fk and column.is_fk:
             continue
 
-        if not include_fk and getattr(column.expression, "foreign_keys", None):
+        yield name, column
+
+
+def _iter_over_orm_paths(
+    obj: Any,
+    *,
+    include: Container[str] | None = None,
+    exclude: Container[str] | None = None,
+) -> Iterator[tuple[str, FilterFieldDef]]:
+    if not isinstance(include, Iterable):
+        return
+
+    for name in include:
+        if (path := _split_path(name)) is None or (exclude is not None and name in exclude):
             continue
 
-        yield name, column
+        if (res := _get_entity_relationship_path(obj, path)) is None:
+            raise ValueError(f"Unknown field {name}")
+
+        yield "__".join(path), adapt_sqlalchemy_column_type(res.column.property)
 
 
 def create_filters_from_orm(
@@ -328,16 +1541,17 @@ def create_filters_from_orm(
     hooks: FiltersCreateHooks | None = None,
     **overrides: FilterFieldDef,
 ) -> FiltersResolver:
-    fields = {
-        name: adapt_sqlalchemy_column_type(column)
-        for name, column in _iter_over_orm_columns(
-            obj,
-            include_fk=include_fk,
-            include=include,
-            exclude=exclude,
-            remapping=remapping,
-        )
-    }
+    columns = _iter_over_orm_columns(
+        obj,
+        include_fk=include_fk,
+        include=include,
+        exclude=exclude,
+        remapping=remapping,
+    )
+    paths = _iter_over_orm_paths(obj, include=include, exclude=exclude)
+
+    fields = {name: _get_orm_column_type(column) for name, column in columns}
+    fields.update(paths)
 
     return create_filters(
         in_=in_,
@@ -376,13 +1590,35 @@ def create_sorting_from_orm(
 
 
 __all__ = [
+    "FilteredCount",
+    "InListStrategy",
+    "PageAndCount",
+    "StreamFormat",
     "adapt_sqlalchemy_column_type",
     "apply_filters",
     "apply_filters_and_sorting",
+    "apply_filters_count",
+    "apply_keyset",
     "apply_sorting",
+    "approximate_count_threshold",
+    "build_count_statement",
+    "count_cache_ttl",
+    "counts_cache_stats",
     "create_filters_from_orm",
+    "create_keyset_cursor",
     "create_sorting_from_orm",
+    "create_streaming_response",
     "custom_add_condition",
     "custom_apply_filter",
+    "fetch_count",
+    "fetch_page_and_count",
+    "filters_shape_cache_stats",
     "generic_condition",
+    "get_filters_shape",
+    "in_list_offload_threshold",
+    "in_list_strategy",
+    "like_prefix_rewrite",
+    "orm_columns_cache_stats",
+    "stream_chunk_size",
+    "stream_rows",
 ]
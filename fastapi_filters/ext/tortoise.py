@@ -4,6 +4,7 @@ from typing import Any, TypeVar, cast
 from tortoise.queryset import QuerySet
 
 from fastapi_filters import FilterOperator, FilterSet, FilterValues
+from fastapi_filters.simplify import filters_simplification_config, simplify_filters
 from fastapi_filters.types import AbstractFilterOperator, SortingValues
 
 TStmt = TypeVar("TStmt", bound=QuerySet[Any])
@@ -38,6 +39,12 @@ def apply_filters(
     if isinstance(filters, FilterSet):
         filters = filters.filter_values
 
+    if filters_simplification_config.get():
+        if (simplified := simplify_filters(filters)) is None:
+            return cast(TStmt, stmt.filter(pk__in=[]))
+
+        filters = simplified
+
     for field, field_filters in filters.items():
         field = remapping.get(field, field)
         field = field.replace(".", "__")
@@ -1,5 +1,5 @@
 import inspect
-from collections.abc import Awaitable, Callable, Mapping, Sequence
+from collections.abc import Awaitable, Callable, Hashable, Mapping, Sequence
 from dataclasses import dataclass
 from typing import (
     Any,
@@ -21,6 +21,25 @@ from .types import AbstractFilterOperator, FiltersResolver, FilterValues
 T_co = TypeVar("T_co", covariant=True)
 
 
+class _LazyFilterSetSignature:
+    # resolver is built only when FastAPI (or anyone else) inspects the signature
+    def __get__(self, instance: Any, owner: type["FilterSet"]) -> inspect.Signature:
+        if instance is not None:
+            raise AttributeError("__signature__")
+
+        return inspect.Signature(
+            parameters=[
+                inspect.Parameter(
+                    name="__values__",
+                    kind=inspect.Parameter.KEYWORD_ONLY,
+                    default=Depends(_filters_from_set(owner)),
+                    annotation=FilterValues,
+                )
+            ],
+            return_annotation=owner,
+        )
+
+
 @dataclass_transform(
     field_specifiers=(FilterField,),
 )
@@ -58,17 +77,7 @@ class FilterSet(BaseModel):
             setattr(cls, field_name, filter_field)
 
         cls.__filters__ = filters
-        cls.__signature__ = inspect.Signature(
-            parameters=[
-                inspect.Parameter(
-                    name="__values__",
-                    kind=inspect.Parameter.KEYWORD_ONLY,
-                    default=Depends(_filters_from_set(cls)),
-                    annotation=FilterValues,
-                )
-            ],
-            return_annotation=cls,
-        )
+        cls.__signature__ = _LazyFilterSetSignature()  # type: ignore[assignment]
 
     @model_validator(mode="before")
     @classmethod
@@ -211,6 +220,9 @@ class _FitlerSetFiltersCreateHooks(FiltersCreateHooks):
 
         return super().filter_field_generate_alias(name, op, alias)
 
+    def filter_resolver_cache_key(self) -> Hashable | None:
+        return type(self), self.filter_set_cls
+
 
 TFiltersSet = TypeVar("TFiltersSet", bound=FilterSet)
 
@@ -218,6 +230,7 @@ TFiltersSet = TypeVar("TFiltersSet", bound=FilterSet)
 def _filters_from_set(
     filters_set: type[TFiltersSet],
 ) -> FiltersResolver:
+    # not memoized per class, as resolver depends on config, create_filters shares it between calls
     return create_filters(
         **{k: v for k, v in filters_set.__filters__.items() if not v.internal},  # type: ignore[arg-type]
         hooks=_FitlerSetFiltersCreateHooks(filters_set),
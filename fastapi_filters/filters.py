@@ -1,20 +1,21 @@
-from collections import defaultdict
-from collections.abc import Callable, Container, Iterator
+from collections.abc import Awaitable, Callable, Container, Hashable, Iterator, Sequence
 from contextlib import ExitStack
-from dataclasses import asdict, dataclass, make_dataclass
+from dataclasses import dataclass, make_dataclass
 from typing import (
     Annotated,
     Any,
     cast,
 )
 
-from fastapi import Depends, Query
+from fastapi import Query
 from pydantic import BaseModel
 from pydantic.fields import FieldInfo
 
+from .cache import LRUCache, freeze
 from .config import ConfigVar
 from .fields import FilterField
 from .operators import FilterOperator
+from .resolvers import FilterParam, FiltersResolverFactory, create_depends_resolver
 from .schemas import CSVList
 from .types import (
     AbstractFilterOperator,
@@ -25,7 +26,6 @@ from .types import (
     FilterValues,
 )
 from .utils import (
-    async_safe,
     fields_include_exclude,
     is_optional,
     is_seq,
@@ -38,6 +38,10 @@ alias_generator_config: ConfigVar[FilterAliasGenerator | None] = ConfigVar(
     "alias_generator",
     default=None,
 )
+filters_resolver_factory_config: ConfigVar[FiltersResolverFactory] = ConfigVar(
+    "filters_resolver_factory",
+    default=create_depends_resolver,
+)
 
 
 @dataclass
@@ -103,6 +107,21 @@ class FiltersCreateHooks:
                 self.filter_field_generate_alias(name, op, field.alias),
             )
 
+    def filter_resolver_create(
+        self,
+        model: type[Any],
+        params: Sequence[FilterParam],
+        in_: FilterPlace,
+    ) -> Callable[..., Awaitable[FilterValues]]:
+        return filters_resolver_factory_config.get()(model, params, in_)
+
+    def filter_resolver_cache_key(self) -> Hashable | None:
+        # subclasses may keep state (including slots), so they are shared only if they provide own cache key
+        if type(self) is not FiltersCreateHooks:
+            return None
+
+        return (type(self),)
+
 
 filters_create_hooks_factory_config: ConfigVar[Callable[[], FiltersCreateHooks]] = ConfigVar(
     "filters_create_hooks_factory",
@@ -139,6 +158,34 @@ def create_filters_from_model(
     )
 
 
+_resolvers_cache: LRUCache[Hashable, FiltersResolver] = LRUCache(maxsize=1024)
+
+
+def _get_resolver_cache_key(
+    fields: dict[str, FilterField[Any]],
+    in_: FilterPlace,
+    alias_generator: FilterAliasGenerator | None,
+    hooks: FiltersCreateHooks,
+) -> Hashable | None:
+    if (hooks_key := hooks.filter_resolver_cache_key()) is None:
+        return None
+
+    try:
+        return freeze(
+            (
+                tuple(
+                    (name, tuple(getattr(field, attr) for attr in field.__fields__)) for name, field in fields.items()
+                ),
+                in_,
+                hooks_key,
+                alias_generator or alias_generator_config.get(),
+                filters_resolver_factory_config.get(),
+            ),
+        )
+    except TypeError:
+        return None
+
+
 def create_filters(
     *,
     in_: FilterPlace | None = None,
@@ -155,6 +202,22 @@ def create_filters(
         name: f_def if isinstance(f_def, FilterField) else FilterField(f_def) for name, f_def in kwargs.items()
     }
 
+    key = _get_resolver_cache_key(fields, in_, alias_generator, hooks)
+    if key is None:
+        return _create_filters(fields, in_, alias_generator, hooks)
+
+    return _resolvers_cache.get_or_create(
+        key,
+        lambda: _create_filters(fields, in_, alias_generator, hooks),
+    )
+
+
+def _create_filters(
+    fields: dict[str, FilterField[Any]],
+    in_: FilterPlace,
+    alias_generator: FilterAliasGenerator | None,
+    hooks: FiltersCreateHooks,
+) -> FiltersResolver:
     with ExitStack() as stack:
         # TODO: maybe better to remove ConvigVar? To many ways to do the same thing
         if alias_generator:
@@ -169,32 +232,32 @@ def create_filters(
             )
         ]
 
-    defs = {fname: (name, op) for name, fname, *_, op in fields_defs}
+    params = [
+        FilterParam(
+            fname=fname,
+            name=name,
+            op=op,
+            alias=alias,
+            type=hooks.filter_field_adapt_type(field, tp, op),
+        )
+        for name, fname, field, tp, alias, op in fields_defs
+    ]
+    defs = {p.fname: (p.name, p.op) for p in params}
 
     filter_model = make_dataclass(
         "Filters",
         [
             (
-                fname,
-                Annotated[
-                    hooks.filter_field_adapt_type(field, tp, op),
-                    in_(alias=alias),
-                ],
+                p.fname,
+                Annotated[p.type, in_(alias=p.alias)],
                 None,
             )
-            for _, fname, field, tp, alias, op in fields_defs
+            for p in params
         ],
+        slots=True,
     )
 
-    async def _get_filters(f: Any = Depends(async_safe(filter_model))) -> FilterValues:
-        values: FilterValues = defaultdict(dict)
-
-        for key, value in asdict(f).items():
-            if value is not None:
-                name, op = defs[key]
-                values[name][op] = value
-
-        return {**values}
+    _get_filters = hooks.filter_resolver_create(filter_model, params, in_)
 
     _get_filters.__model__ = filter_model  # type: ignore[attr-defined]
     _get_filters.__defs__ = defs  # type: ignore[attr-defined]
@@ -208,4 +271,5 @@ __all__ = [
     "alias_generator_config",
     "create_filters",
     "create_filters_from_model",
+    "filters_resolver_factory_config",
 ]
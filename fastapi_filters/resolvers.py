@@ -0,0 +1,179 @@
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, TypeAlias
+
+from fastapi import Depends, Query, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
+from starlette.datastructures import QueryParams
+from typing_extensions import NotRequired, TypedDict
+
+from .schemas import CSV_SEPARATOR_CONTEXT_KEY, csv_separator_config
+from .types import AbstractFilterOperator, FilterPlace, FilterValues
+from .utils import async_safe, is_seq
+
+
+@dataclass(frozen=True)
+class FilterParam:
+    fname: str
+    name: str
+    op: AbstractFilterOperator
+    alias: str | None
+    type: Any
+
+    @property
+    def key(self) -> str:
+        return self.alias or self.fname
+
+
+FiltersResolverFactory: TypeAlias = Callable[
+    [type[Any], Sequence[FilterParam], FilterPlace],
+    Callable[..., Awaitable[FilterValues]],
+]
+
+
+def create_depends_resolver(
+    model: type[Any],
+    params: Sequence[FilterParam],
+    in_: FilterPlace,
+) -> Callable[..., Awaitable[FilterValues]]:
+    accessors = tuple((p.fname, p.name, p.op) for p in params)
+
+    async def _get_filters(f: Any = Depends(async_safe(model))) -> FilterValues:
+        values: FilterValues = {}
+
+        for fname, name, op in accessors:
+            if (value := getattr(f, fname)) is not None:
+                if name in values:
+                    values[name][op] = value
+                else:
+                    values[name] = {op: value}
+
+        return values
+
+    return _get_filters
+
+
+@dataclass(frozen=True)
+class _QueryParamEntry:
+    pos: int
+    name: str
+    op: AbstractFilterOperator
+    is_seq: bool
+
+
+def _get_query_params_entries(
+    params: Sequence[FilterParam],
+    in_: FilterPlace,
+) -> dict[str, _QueryParamEntry]:
+    if in_ is not Query:
+        raise ValueError("Query params resolver supports only query parameters")
+
+    return {
+        p.key: _QueryParamEntry(
+            pos=pos,
+            name=p.name,
+            op=p.op,
+            is_seq=is_seq(p.type),
+        )
+        for pos, p in enumerate(params)
+    }
+
+
+def _get_present_query_params(
+    query_params: QueryParams,
+    entries: Mapping[str, _QueryParamEntry],
+) -> list[tuple[str, _QueryParamEntry, Any]]:
+    # keep declaration order, so result is the same as for the default resolver
+    present = sorted(
+        ((key, entry) for key in query_params if (entry := entries.get(key))),
+        key=lambda item: item[1].pos,
+    )
+
+    return [(key, entry, query_params.getlist(key) if entry.is_seq else query_params[key]) for key, entry in present]
+
+
+def _get_validation_context() -> dict[str, Any]:
+    return {CSV_SEPARATOR_CONTEXT_KEY: csv_separator_config.get()}
+
+
+def _regenerate_errors(exc: ValidationError, *loc: str) -> list[Any]:
+    return [{**err, "loc": (*loc, *err["loc"])} for err in exc.errors(include_url=False)]
+
+
+def create_query_params_resolver(
+    model: type[Any],
+    params: Sequence[FilterParam],
+    in_: FilterPlace,
+) -> Callable[..., Awaitable[FilterValues]]:
+    entries = _get_query_params_entries(params, in_)
+    adapters = {p.key: TypeAdapter(p.type) for p in params}
+
+    async def _get_filters(request: Request) -> FilterValues:
+        context = _get_validation_context()
+        values: FilterValues = {}
+        errors: list[Any] = []
+
+        for key, entry, raw in _get_present_query_params(request.query_params, entries):
+            try:
+                value = adapters[key].validate_python(raw, context=context)
+            except ValidationError as exc:
+                errors.extend(_regenerate_errors(exc, "query", key))
+                continue
+
+            if value is not None:
+                values.setdefault(entry.name, {})[entry.op] = value
+
+        if errors:
+            raise RequestValidationError(errors)
+
+        return values
+
+    _get_filters.__openapi_model__ = model  # type: ignore[attr-defined]
+
+    return _get_filters
+
+
+def create_batch_query_params_resolver(
+    model: type[Any],
+    params: Sequence[FilterParam],
+    in_: FilterPlace,
+) -> Callable[..., Awaitable[FilterValues]]:
+    entries = _get_query_params_entries(params, in_)
+    adapter: TypeAdapter[dict[str, Any]] = TypeAdapter(
+        TypedDict(  # type: ignore[operator]
+            model.__name__,
+            {p.key: NotRequired[p.type] for p in params},
+        ),
+    )
+
+    async def _get_filters(request: Request) -> FilterValues:
+        present = _get_present_query_params(request.query_params, entries)
+
+        try:
+            validated = adapter.validate_python(
+                {key: raw for key, _, raw in present},
+                context=_get_validation_context(),
+            )
+        except ValidationError as exc:
+            raise RequestValidationError(_regenerate_errors(exc, "query")) from None
+
+        values: FilterValues = {}
+        for key, entry, _ in present:
+            if (value := validated[key]) is not None:
+                values.setdefault(entry.name, {})[entry.op] = value
+
+        return values
+
+    _get_filters.__openapi_model__ = model  # type: ignore[attr-defined]
+
+    return _get_filters
+
+
+__all__ = [
+    "FilterParam",
+    "FiltersResolverFactory",
+    "create_batch_query_params_resolver",
+    "create_depends_resolver",
+    "create_query_params_resolver",
+]
@@ -1,18 +1,34 @@
 from typing import Annotated, Any, TypeAlias, TypeVar
 
-from pydantic import BeforeValidator, GetPydanticSchema
+from pydantic import GetPydanticSchema, ValidationInfo
+from pydantic_core import core_schema
 
 from .config import ConfigVar
 
 csv_separator_config: ConfigVar[str] = ConfigVar("csv_separator", default=",")
 
+# resolvers that validate values by themselves pass separator through validation context,
+# so it is resolved once per request instead of once per value
+CSV_SEPARATOR_CONTEXT_KEY = "csv_separator"
 
-def csv_list_validator(v: Any) -> Any:
+
+def _get_csv_separator(info: ValidationInfo | None) -> str:
+    if info is not None and info.context and (separator := info.context.get(CSV_SEPARATOR_CONTEXT_KEY)):
+        return separator  # type: ignore[no-any-return]
+
+    return csv_separator_config.get()
+
+
+def csv_list_validator(v: Any, info: ValidationInfo | None = None) -> Any:
     match v:
         case str():
-            return v.split(csv_separator_config.get())
+            return v.split(_get_csv_separator(info))
         case [str() as s]:
-            return s.split(csv_separator_config.get())
+            return s.split(_get_csv_separator(info))
+        case list() if all(isinstance(s, str) for s in v):
+            # repeated query params (?id=1&id=2,3) are merged into one list
+            separator = _get_csv_separator(info)
+            return [item for s in v for item in s.split(separator)]
         case _:
             return v
 
@@ -21,8 +37,11 @@ T = TypeVar("T")
 
 CSVList: TypeAlias = Annotated[
     list[T],
-    BeforeValidator(csv_list_validator),
     GetPydanticSchema(
+        get_pydantic_core_schema=lambda source, handler: core_schema.with_info_before_validator_function(
+            csv_list_validator,
+            handler(source),
+        ),
         get_pydantic_json_schema=lambda core_schema, handler: {
             **handler.resolve_ref_schema(handler(core_schema)),
             "explode": False,
@@ -31,6 +50,7 @@ CSVList: TypeAlias = Annotated[
 ]
 
 __all__ = [
+    "CSV_SEPARATOR_CONTEXT_KEY",
     "CSVList",
     "csv_separator_config",
 ]
@@ -0,0 +1,197 @@
+import operator
+from collections.abc import Callable, Iterable, Mapping
+from datetime import date, time, timedelta
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from .config import ConfigVar
+from .operators import FilterOperator
+from .types import AbstractFilterOperator, FilterValues
+
+filters_simplification_config: ConfigVar[bool] = ConfigVar(
+    "filters_simplification",
+    default=False,
+)
+
+# types which are compared by database in the same way as in python,
+# strings are not here as their comparison depends on database collation
+_COMPARABLE_TYPES = (int, float, Decimal, date, time, timedelta, UUID)
+
+_LOWER_BOUNDS = (FilterOperator.gt, FilterOperator.ge)
+_UPPER_BOUNDS = (FilterOperator.lt, FilterOperator.le)
+
+_CHECKS: Mapping[AbstractFilterOperator, Callable[[Any, Any], bool]] = {
+    FilterOperator.ne: operator.ne,
+    FilterOperator.gt: operator.gt,
+    FilterOperator.ge: operator.ge,
+    FilterOperator.lt: operator.lt,
+    FilterOperator.le: operator.le,
+}
+
+
+class _UnsatisfiableError(Exception):
+    pass
+
+
+def _dedupe(values: Iterable[Any]) -> list[Any]:
+    values = [*values]
+
+    try:
+        return [*dict.fromkeys(values)]
+    except TypeError:  # unhashable values
+        return values
+
+
+def _is_comparable(*values: Any) -> bool:
+    return all(isinstance(val, _COMPARABLE_TYPES) for val in values)
+
+
+def _get_bound(
+    filters: dict[AbstractFilterOperator, Any],
+    strict: AbstractFilterOperator,
+    inclusive: AbstractFilterOperator,
+    tighter: Callable[[Any, Any], bool],
+) -> tuple[Any, bool] | None:
+    if strict not in filters:
+        return (filters[inclusive], False) if inclusive in filters else None
+    if inclusive not in filters:
+        return filters[strict], True
+
+    strict_val, inclusive_val = filters.pop(strict), filters.pop(inclusive)
+    if tighter(inclusive_val, strict_val):
+        filters[inclusive] = inclusive_val
+        return inclusive_val, False
+
+    filters[strict] = strict_val
+    return strict_val, True
+
+
+def _simplify_range(filters: dict[AbstractFilterOperator, Any]) -> None:
+    if not _is_comparable(*(filters[op] for op in (*_LOWER_BOUNDS, *_UPPER_BOUNDS) if op in filters)):
+        return
+
+    lower = _get_bound(filters, FilterOperator.gt, FilterOperator.ge, operator.gt)
+    upper = _get_bound(filters, FilterOperator.lt, FilterOperator.le, operator.lt)
+
+    if lower is None or upper is None:
+        return
+
+    (low, low_strict), (high, high_strict) = lower, upper
+    if low > high or (low == high and (low_strict or high_strict)):
+        raise _UnsatisfiableError
+
+    if low == high:
+        for op in (*_LOWER_BOUNDS, *_UPPER_BOUNDS):
+            filters.pop(op, None)
+
+        filters.setdefault(FilterOperator.eq, low)
+
+
+def _matches(filters: dict[AbstractFilterOperator, Any], val: Any) -> bool:
+    if val in filters.get(FilterOperator.not_in, ()):
+        return False
+
+    return all(check(val, filters[op]) for op, check in _CHECKS.items() if op in filters)
+
+
+def _simplify_candidates(filters: dict[AbstractFilterOperator, Any]) -> None:
+    if FilterOperator.in_ in filters and not filters[FilterOperator.in_]:
+        raise _UnsatisfiableError
+
+    candidates = [filters[FilterOperator.eq]] if FilterOperator.eq in filters else filters.get(FilterOperator.in_)
+    if candidates is None:
+        return
+
+    bounds = [filters[op] for op in (FilterOperator.ne, *_LOWER_BOUNDS, *_UPPER_BOUNDS) if op in filters]
+    if not _is_comparable(
+        *candidates, *filters.get(FilterOperator.in_, ()), *bounds, *filters.get(FilterOperator.not_in, ())
+    ):
+        # equality of other values (e.g. strings) depends on database, only single IN value is safe to collapse
+        if FilterOperator.eq not in filters and len(candidates) == 1:
+            filters[FilterOperator.eq] = filters.pop(FilterOperator.in_)[0]
+
+        return
+
+    if FilterOperator.eq in filters and FilterOperator.in_ in filters:
+        candidates = [val for val in candidates if val in filters[FilterOperator.in_]]
+
+    candidates = [val for val in candidates if _matches(filters, val)]
+    if not candidates:
+        raise _UnsatisfiableError
+
+    # explicitly listed values already satisfy all other comparisons
+    for op in (
+        FilterOperator.eq,
+        FilterOperator.in_,
+        FilterOperator.ne,
+        FilterOperator.not_in,
+        *_LOWER_BOUNDS,
+        *_UPPER_BOUNDS,
+    ):
+        filters.pop(op, None)
+
+    if len(candidates) == 1:
+        filters[FilterOperator.eq] = candidates[0]
+    else:
+        filters[FilterOperator.in_] = candidates
+
+
+def _simplify_excluded(filters: dict[AbstractFilterOperator, Any]) -> None:
+    excluded = [filters.pop(FilterOperator.ne)] if FilterOperator.ne in filters else []
+    excluded = _dedupe([*excluded, *filters.pop(FilterOperator.not_in, ())])
+
+    if len(excluded) == 1:
+        filters[FilterOperator.ne] = excluded[0]
+    elif excluded:
+        filters[FilterOperator.not_in] = excluded
+
+
+def _simplify_field_filters(
+    field_filters: dict[AbstractFilterOperator, Any],
+    *,
+    sql_nulls: bool,
+) -> dict[AbstractFilterOperator, Any]:
+    filters = {**field_filters}
+
+    for op in (FilterOperator.in_, FilterOperator.not_in):
+        if op in filters:
+            filters[op] = _dedupe(filters[op])
+
+    # in SQL any comparison with NULL is never true, so other filters imply IS NOT NULL,
+    # other backends (e.g. MongoDB $ne/$nin) match null values by negative comparisons
+    if sql_nulls and FilterOperator.is_null in filters and len(filters) > 1 and filters.pop(FilterOperator.is_null):
+        raise _UnsatisfiableError
+
+    _simplify_range(filters)
+    _simplify_candidates(filters)
+    _simplify_excluded(filters)
+
+    return filters
+
+
+def _try_simplify_field_filters(
+    field_filters: dict[AbstractFilterOperator, Any],
+    *,
+    sql_nulls: bool,
+) -> dict[AbstractFilterOperator, Any]:
+    try:
+        return _simplify_field_filters(field_filters, sql_nulls=sql_nulls)
+    except TypeError:  # values can not be compared (e.g. naive and aware datetimes)
+        return field_filters
+
+
+def simplify_filters(filters: FilterValues, *, sql_nulls: bool = False) -> FilterValues | None:
+    try:
+        return {
+            field: _try_simplify_field_filters(field_filters, sql_nulls=sql_nulls)
+            for field, field_filters in filters.items()
+        }
+    except _UnsatisfiableError:
+        return None
+
+
+__all__ = [
+    "filters_simplification_config",
+    "simplify_filters",
+]
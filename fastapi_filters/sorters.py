@@ -1,11 +1,14 @@
-from collections.abc import Container
-from typing import Annotated, Literal, cast
+import re
+from collections.abc import Container, Hashable
+from typing import Annotated, Any, Literal, cast
 
 from fastapi import Query
-from pydantic import BaseModel
+from pydantic import BaseModel, GetPydanticSchema, ValidationInfo
+from pydantic_core import PydanticCustomError, PydanticKnownError, core_schema
 
-from .schemas import CSVList
-from .types import FilterPlace, SortingNulls, SortingResolver, SortingValues
+from .cache import LRUCache, freeze
+from .schemas import CSVList, csv_list_validator
+from .types import FilterPlace, SortingDirection, SortingNulls, SortingResolver, SortingValues
 from .utils import fields_include_exclude, is_complex_field
 
 
@@ -16,6 +19,8 @@ def create_sorting_from_model(
     in_: FilterPlace | None = None,
     include: Container[str] | None = None,
     exclude: Container[str] | None = None,
+    compiled: bool = False,
+    max_keys: int | None = None,
 ) -> SortingResolver:
     checker = fields_include_exclude(model.model_fields, include, exclude)
 
@@ -23,35 +28,129 @@ def create_sorting_from_model(
         *[name for name, field in model.model_fields.items() if checker(name) and not is_complex_field(field)],
         in_=in_,
         default=default,
+        compiled=compiled,
+        max_keys=max_keys,
     )
 
 
+_resolvers_cache: LRUCache[Hashable, SortingResolver] = LRUCache(maxsize=1024)
+
+
 def create_sorting(
     *fields: str | tuple[str, SortingNulls],
     in_: FilterPlace | None = None,
     default: str | list[str] | None = None,
     alias: str | None = None,
+    compiled: bool = False,
+    max_keys: int | None = None,
 ) -> SortingResolver:
     if in_ is None:
         in_ = Query
 
+    if max_keys is not None and not compiled:
+        raise ValueError("max_keys is supported only by compiled sorting")
+
     normalized_fields = [(f, None) if isinstance(f, str) else f for f in fields]
+    default = [default] if isinstance(default, str) else default
+
+    key = freeze((normalized_fields, in_, default, alias, compiled, max_keys))
+    return _resolvers_cache.get_or_create(
+        key,
+        lambda: _create_sorting(normalized_fields, in_, default, alias, compiled=compiled, max_keys=max_keys),
+    )
 
-    defs = {f"{d}{f}": (f, v, n) for (v, d) in (("asc", "+"), ("asc", ""), ("desc", "-")) for f, n in normalized_fields}
-    tp = Literal[tuple(defs)]  # type: ignore[valid-type]
 
-    default = [default] if isinstance(default, str) else default
+SortingDefs = dict[str, tuple[str, SortingDirection, SortingNulls]]
+
+
+def _compiled_sort_type(defs: SortingDefs, max_keys: int | None) -> Any:
+    # one dict lookup per token instead of validation against Literal with 3 entries per field
+    names = dict.fromkeys(name for name, *_ in defs.values())
+    json_schema: dict[str, Any] = {
+        "type": "array",
+        "items": {
+            "type": "string",
+            "pattern": f"^[+-]?({'|'.join(re.escape(name) for name in names)})$",
+        },
+        "explode": False,
+    }
+    if max_keys is not None:
+        json_schema["maxItems"] = max_keys
+
+    def _validate(v: Any, info: ValidationInfo) -> list[str]:
+        tokens = csv_list_validator(v, info)
+        if not isinstance(tokens, list) or not all(isinstance(token, str) for token in tokens):
+            raise PydanticKnownError("list_type")
+
+        if max_keys is not None and len(tokens) > max_keys:
+            raise PydanticKnownError(
+                "too_long",
+                {"field_type": "List", "max_length": max_keys, "actual_length": len(tokens)},
+            )
+
+        seen: set[str] = set()
+        for token in tokens:
+            # Strip whitespace to handle URL-encoded '+' (decoded as space)
+            if (sort_def := defs.get(token.strip())) is None:
+                raise PydanticCustomError(
+                    "sort_field",
+                    "Sort field {field} is not one of {fields}",
+                    {"field": token, "fields": ",".join(names)},
+                )
+
+            if sort_def[0] in seen:
+                raise PydanticCustomError(
+                    "sort_field_duplicate",
+                    "Sort field {field} is specified more than once",
+                    {"field": sort_def[0]},
+                )
+
+            seen.add(sort_def[0])
+
+        return tokens
+
+    return Annotated[
+        list[str],
+        GetPydanticSchema(
+            get_pydantic_core_schema=lambda *_: core_schema.with_info_plain_validator_function(_validate),
+            get_pydantic_json_schema=lambda *_: json_schema,
+        ),
+    ]
+
+
+def _create_sorting(
+    normalized_fields: list[tuple[str, SortingNulls]],
+    in_: FilterPlace,
+    default: list[str] | None,
+    alias: str | None,
+    *,
+    compiled: bool,
+    max_keys: int | None,
+) -> SortingResolver:
+    defs: SortingDefs = {
+        f"{d}{f}": (f, v, n)  # type: ignore[misc]
+        for (v, d) in (("asc", "+"), ("asc", ""), ("desc", "-"))
+        for f, n in normalized_fields
+    }
 
     if default and (diff := {*default} - {*defs}):
         raise ValueError(
             f"Default sort field {','.join(diff)} is not in {','.join(f for f, _ in normalized_fields)}",
         )
 
+    if compiled:
+        # tokens are validated against defs, so Literal of all tokens is not needed
+        tp: Any = str
+        sort_tp = _compiled_sort_type(defs, max_keys)
+    else:
+        tp = Literal[tuple(defs)]
+        sort_tp = CSVList[tp]
+
     async def _get_sorters(
-        sort: Annotated[CSVList[tp], in_(alias=alias)] = default,  # type: ignore[valid-type,assignment]
+        sort: Annotated[sort_tp, in_(alias=alias)] = default,  # type: ignore[valid-type]
     ) -> SortingValues:
         # Strip whitespace to handle URL-encoded '+' (decoded as space)
-        return cast(SortingValues, [defs[cast(str, f).strip()] for f in sort or ()])
+        return [defs[f.strip()] for f in cast(list[str], sort or ())]
 
     _get_sorters.__tp__ = tp  # type: ignore[attr-defined]
     _get_sorters.__defs__ = defs  # type: ignore[attr-defined]
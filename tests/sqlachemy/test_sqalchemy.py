@@ -1,19 +1,74 @@
+import gc
+import weakref
+from datetime import datetime
 from typing import Any
 
 import pytest
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, select, true
+from fastapi.exceptions import RequestValidationError
+from pytest_asyncio import fixture as async_fixture
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    TypeDecorator,
+    create_engine,
+    func,
+    literal,
+    select,
+    true,
+)
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.dialects.postgresql import ARRAY
-from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, aliased, configure_mappers, declarative_base, joinedload, relationship
 
 from fastapi_filters import FilterField, FilterSet
+from fastapi_filters.cache import CacheStats
+from fastapi_filters.config import ConfigSnapshot
+from fastapi_filters.cursor import decode_cursor, encode_cursor
 from fastapi_filters.ext.sqlalchemy import (
+    DEFAULT_FILTERS,
+    FilteredCount,
+    _build_entity_namespace,
+    _counts_cache,
+    _entity_namespace_cache,
+    _Explain,
+    _filters_shape_cache,
+    _get_entity_namespace,
+    _get_orm_columns,
+    _get_rows_statement,
+    _get_stmt_cache_key,
     apply_filters,
     apply_filters_and_sorting,
+    apply_filters_count,
+    apply_keyset,
     apply_sorting,
+    approximate_count_threshold,
+    build_count_statement,
+    count_cache_ttl,
     create_filters_from_orm,
+    create_keyset_cursor,
     create_sorting_from_orm,
+    create_streaming_response,
+    custom_apply_filter,
+    fetch_count,
+    fetch_page_and_count,
+    filters_shape_cache_stats,
+    get_filters_shape,
+    in_list_offload_threshold,
+    in_list_strategy,
+    like_prefix_rewrite,
+    orm_columns_cache_stats,
+    stream_chunk_size,
+    stream_rows,
 )
 from fastapi_filters.operators import FilterOperator
+from fastapi_filters.operators import disabled_filters_config as disabled_filters
+from fastapi_filters.simplify import filters_simplification_config
 
 Base = declarative_base()
 
@@ -291,3 +346,700 @@ def test_create_sorting_from_orm():
         "-name": ("name", "desc", None),
         "+name": ("name", "asc", None),
     }
+
+
+def test_apply_filters_config_snapshot():
+    def _apply_filter(stmt, ns, field, op, val):
+        return ns[field] == val + 1
+
+    with custom_apply_filter.set(_apply_filter):
+        config = ConfigSnapshot.capture()
+
+    filtered_stmt = apply_filters(select(User), {"age": {FilterOperator.eq: 10}}, config=config)
+
+    assert _compile_expr(filtered_stmt.whereclause) == _compile_expr(User.age == 11)
+
+
+KeysetBase = declarative_base()
+
+
+class Item(KeysetBase):
+    __tablename__ = "items"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+    score = Column(Integer)
+    created_at = Column(DateTime)
+
+
+def test_apply_keyset_row_value_comparison():
+    stmt = apply_keyset(select(Item), [("name", "desc", None)], ["item", 10])
+
+    assert _compile_expr(stmt.whereclause) == "(items.name, items.id) < ('item', 10)"
+    assert [_compile_expr(clause) for clause in stmt._order_by_clauses] == ["items.name DESC", "items.id DESC"]
+
+
+def test_apply_keyset_invalid_cursor():
+    with pytest.raises(ValueError, match=r"^Unable to detect primary key, pass tie_breaker explicitly$"):
+        apply_keyset(select(literal(1).label("age")), [("age", "asc", None)], None)
+
+    with pytest.raises(ValueError, match=r"^Nullable field 'score' requires explicit nulls position"):
+        apply_keyset(select(Item), [("score", "desc", None)], None)
+
+
+@pytest.mark.parametrize(
+    ("sorting", "cursor", "loc"),
+    [
+        # cursor of another sort order
+        ([("name", "asc", None)], encode_cursor([3, "item", 10]), ("query", "cursor")),
+        ([("score", "asc", "bigger"), ("name", "asc", None)], encode_cursor(["item", 10]), ("query", "cursor")),
+        # tampered values
+        ([("name", "asc", None)], encode_cursor(["item", "ten"]), ("query", "cursor", 1)),
+        ([("created_at", "asc", "bigger")], encode_cursor(["yesterday", 10]), ("query", "cursor", 0)),
+    ],
+)
+def test_apply_keyset_client_cursor_errors(sorting, cursor, loc):
+    with pytest.raises(RequestValidationError) as exc_info:
+        apply_keyset(select(Item), sorting, decode_cursor(cursor))
+
+    assert [err["loc"] for err in exc_info.value.errors()] == [loc]
+
+
+@pytest.mark.parametrize(
+    "sorting",
+    [
+        [("name", "asc", None)],
+        [("name", "desc", None)],
+        [("score", "asc", "bigger"), ("name", "desc", None)],
+        [("score", "desc", "bigger")],
+        [("score", "asc", "smaller"), ("created_at", "desc", "smaller")],
+        [("created_at", "desc", "bigger"), ("score", "asc", "bigger")],
+    ],
+)
+def test_apply_keyset_pages(sorting):
+    engine = create_engine("sqlite://")
+    KeysetBase.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add_all(
+            Item(
+                id=i,
+                name=f"item-{i % 4}",
+                score=None if i % 3 == 0 else i % 5,
+                created_at=None if i % 4 == 0 else datetime(2024, 1, i % 7 + 1),  # noqa: DTZ001
+            )
+            for i in range(1, 31)
+        )
+        session.commit()
+
+        expected = session.scalars(apply_keyset(select(Item), sorting, None)).all()
+
+        pages, cursor = [], None
+        while True:
+            stmt = apply_keyset(select(Item), sorting, cursor and decode_cursor(cursor)).limit(7)
+            if not (page := session.scalars(stmt).all()):
+                break
+
+            pages.extend(page)
+            cursor = create_keyset_cursor(page[-1], select(Item), sorting)
+
+    assert [item.id for item in pages] == [item.id for item in expected]
+    assert len(expected) == 30  # noqa: PLR2004
+
+
+def test_apply_filters_add_condition():
+    def _add_condition(stmt, field, cond):
+        if field == "age":
+            return stmt.having(cond)
+
+        raise NotImplementedError
+
+    stmt = apply_filters(
+        select(User).group_by(User.id),
+        {
+            "name": {FilterOperator.eq: "test"},
+            "age": {FilterOperator.gt: 18},
+            "group_id": {FilterOperator.eq: 1},
+        },
+        add_condition=_add_condition,
+    )
+
+    assert _compile_expr(stmt.whereclause) == _compile_expr((User.name == "test") & (User.group_id == 1))
+    assert _compile_expr(stmt._having_criteria[0]) == _compile_expr(User.age > 18)  # noqa: PLR2004
+
+
+def test_apply_filters_add_condition_sees_preceding_conditions():
+    seen = []
+
+    def _add_condition(stmt, field, cond):
+        seen.append((field, _compile_expr(stmt.whereclause) if stmt.whereclause is not None else None))
+        if field == "age":
+            return stmt.where(cond)
+
+        raise NotImplementedError
+
+    stmt = apply_filters(
+        select(User),
+        {
+            "name": {FilterOperator.eq: "test"},
+            "age": {FilterOperator.gt: 18},
+            "group_id": {FilterOperator.eq: 1},
+        },
+        add_condition=_add_condition,
+    )
+
+    assert seen == [
+        ("name", None),
+        ("age", _compile_expr(User.name == "test")),
+        ("group_id", _compile_expr((User.name == "test") & (User.age > 18))),  # noqa: PLR2004
+    ]
+    assert _compile_expr(stmt.whereclause) == _compile_expr(
+        (User.name == "test") & (User.age > 18) & (User.group_id == 1),  # noqa: PLR2004
+    )
+
+
+def test_entity_namespace_cache():
+    _entity_namespace_cache.clear()
+
+    for factory in [lambda: select(User), lambda: select(User).join(Group).where(User.age > 1)]:
+        stmt = factory()
+
+        assert _get_entity_namespace(stmt) == _build_entity_namespace(stmt.get_final_froms())
+        assert _get_entity_namespace(factory()) is _get_entity_namespace(stmt)
+
+    assert _entity_namespace_cache.stats().size == 2  # noqa: PLR2004
+    assert _get_entity_namespace(select(User).where(Group.id == 1)).keys() > _get_entity_namespace(select(User)).keys()
+
+
+def test_stmt_cache_key_does_not_keep_statements_alive():
+    stmt = apply_filters(select(User), {"age": {FilterOperator.in_: list(range(1_000))}})
+    ref = weakref.ref(stmt)
+
+    assert _get_stmt_cache_key(stmt) is _get_stmt_cache_key(stmt)
+
+    del stmt
+    gc.collect()
+
+    assert ref() is None
+
+
+def test_entity_namespace_cache_aliases():
+    for _ in range(2):
+        alias = aliased(User)
+        stmt = apply_filters(select(alias), {"age": {FilterOperator.gt: 1}})
+
+        assert len(stmt.get_final_froms()) == 1
+
+
+def _users_cte():
+    return select(User.id, User.age).cte("c")
+
+
+def _json_each():
+    return func.json_each("[]").table_valued("value", name="j")
+
+
+@pytest.mark.parametrize(("factory", "field"), [(_users_cte, "age"), (_json_each, "value")])
+def test_entity_namespace_cache_same_named_froms(factory, field):
+    for _ in range(2):
+        from_ = factory()
+        stmt = select(from_)
+
+        assert _get_entity_namespace(stmt)[field] is from_.c[field]
+        assert _get_entity_namespace(select(factory()))[field] is not from_.c[field]
+
+
+def test_filters_shape():
+    assert get_filters_shape(
+        {
+            "age": {FilterOperator.gt: 1, FilterOperator.in_: [1, 2, 3]},
+            "name": {FilterOperator.is_null: False},
+        },
+    ) == (
+        ("age", FilterOperator.gt, int),
+        ("age", FilterOperator.in_, ("seq", 4)),
+        ("name", FilterOperator.is_null, bool),
+    )
+
+
+def test_filters_shape_cache():
+    _filters_shape_cache.clear()
+
+    for age in range(3):
+        stmt = apply_filters(select(User), {"age": {FilterOperator.gt: age, FilterOperator.in_: [age]}})
+
+        assert _compile_expr(stmt.whereclause) == _compile_expr((User.age > age) & User.age.in_([age]))
+
+    apply_filters(select(User), {"age": {FilterOperator.gt: 1}})
+
+    assert filters_shape_cache_stats() == CacheStats(hits=2, misses=2, size=2, maxsize=1024)
+
+
+@pytest.mark.parametrize(("factory", "field"), [(_users_cte, "age"), (_json_each, "value")])
+def test_filters_shape_cache_same_named_froms(factory, field):
+    for _ in range(2):
+        from_ = factory()
+        stmt = apply_filters(select(from_), {field: {FilterOperator.eq: 3}})
+
+        assert stmt.whereclause.left is from_.c[field]
+        assert stmt.get_final_froms() == [from_]
+
+
+@pytest.mark.parametrize(
+    ("strategy", "expected"),
+    [
+        ("in", "users.age IN (1, 2, 3) AND (users.age NOT IN (4))"),
+        ("any", "users.age = ANY (ARRAY[1, 2, 3]) AND users.age != ALL (ARRAY[4])"),
+        ("bucket", "users.age IN (1, 2, 3, 3) AND (users.age NOT IN (4))"),
+    ],
+)
+def test_apply_filters_in_list_strategy(strategy, expected):
+    with in_list_strategy.set(strategy):
+        stmt = apply_filters(select(User), {"age": {FilterOperator.in_: [1, 2, 3], FilterOperator.not_in: [4]}})
+
+    compiled = stmt.whereclause.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    assert str(compiled) == expected
+
+
+def test_apply_filters_in_list_offload_postgresql():
+    filters = {"age": {FilterOperator.in_: [*range(501)], FilterOperator.not_in: [1, 2]}}
+
+    # disabled by default
+    stmt = apply_filters(select(User), filters)
+    assert "ANY" not in str(stmt.whereclause.compile(dialect=postgresql.dialect()))
+
+    with in_list_offload_threshold.set(500):
+        stmt = apply_filters(select(User), filters)
+
+    compiled = stmt.whereclause.compile(dialect=postgresql.dialect())
+
+    assert str(compiled) == "users.age = ANY (%(age_1)s::INTEGER[]) AND (users.age NOT IN (__[POSTCOMPILE_age_2]))"
+    assert compiled.params == {"age_1": [*range(501)], "age_2": [1, 2]}
+
+
+def test_apply_filters_in_list_offload_sqlite():
+    engine = create_engine("sqlite://")
+    KeysetBase.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add_all(Item(id=i, name=f"item-{i}") for i in range(1, 11))
+        session.commit()
+
+        # more values than SQLite default parameters limit, statement compiled once is reused with new values
+        for ids in [[*range(5, 40_000)], [*range(8, 40_000)]]:
+            with in_list_offload_threshold.set(100):
+                in_stmt = apply_filters(select(Item.id), {"id": {FilterOperator.in_: ids}})
+                not_in_stmt = apply_filters(select(Item.id), {"id": {FilterOperator.not_in: ids}})
+
+            assert session.scalars(in_stmt).all() == [i for i in range(1, 11) if i in ids]
+            assert session.scalars(not_in_stmt).all() == [i for i in range(1, 11) if i not in ids]
+
+
+@pytest.mark.parametrize(
+    ("filters", "expected"),
+    [
+        ({"age": {FilterOperator.gt: 5, FilterOperator.le: 3}}, "false"),
+        ({"age": {FilterOperator.in_: [1, 1], FilterOperator.gt: 0}}, "users.age = 1"),
+    ],
+)
+def test_apply_filters_simplification(filters, expected):
+    with filters_simplification_config.set(True):
+        stmt = apply_filters(select(User), filters)
+
+    compiled = stmt.whereclause.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    assert str(compiled) == expected
+
+
+@pytest.mark.parametrize(
+    ("op", "pattern", "expected"),
+    [
+        (
+            FilterOperator.like,
+            "jo%",
+            """(users.name COLLATE "C") >= 'jo' AND (users.name COLLATE "C") < 'jp' AND users.name LIKE 'jo%'""",
+        ),
+        (
+            FilterOperator.like,
+            "j\\_o%",
+            r"""(users.name COLLATE "C") >= 'j_o' AND (users.name COLLATE "C") < 'j_p' AND users.name LIKE 'j\\_o%'""",
+        ),
+        (
+            FilterOperator.ilike,
+            "JO%",
+            (
+                """(lower(users.name) COLLATE "C") >= 'jo' AND (lower(users.name) COLLATE "C") < 'jp' """
+                """AND lower(users.name) LIKE 'jo%'"""
+            ),
+        ),
+        (FilterOperator.ilike, "%JO", "lower(users.name) LIKE '%jo'"),
+        (FilterOperator.not_ilike, "JO%", "lower(users.name) NOT LIKE 'jo%'"),
+        (FilterOperator.like, "j_%", "users.name LIKE 'j_%'"),
+        (FilterOperator.like, "jo", "users.name LIKE 'jo'"),
+        (FilterOperator.not_like, "jo%", "users.name NOT LIKE 'jo%'"),
+    ],
+)
+def test_apply_filters_like_prefix_rewrite(op, pattern, expected):
+    with like_prefix_rewrite.set(True):
+        stmt = apply_filters(select(User), {"name": {op: pattern}})
+
+    compiled = stmt.whereclause.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    # "%" are escaped in literals by pyformat paramstyle
+    assert str(compiled).replace("%%", "%") == expected
+
+
+class _Version(TypeDecorator):
+    impl = String
+    cache_ok = True
+
+    def coerce_compared_value(self, op, value):
+        return Integer() if isinstance(value, int) else self
+
+
+@pytest.mark.parametrize(
+    ("column", "op", "val"),
+    [
+        (Column("version", _Version()), FilterOperator.eq, "1.0"),
+        (Column("version", _Version()), FilterOperator.gt, 1),
+        (Column("version", _Version()), FilterOperator.in_, [1, 2]),
+        (Column("age", Integer()), FilterOperator.like, "1%"),
+        (Column("age", Integer()), FilterOperator.ge, 1),
+    ],
+)
+def test_apply_filters_bind_type_coercion(column, op, val):
+    Table("versions", MetaData(), column)
+    expected = DEFAULT_FILTERS[op](column, val).right.type
+
+    for _ in range(2):  # second call uses filters shape cache
+        stmt = apply_filters(select(column), {column.name: {op: val}})
+
+        assert type(stmt.whereclause.right.type) is type(expected)
+
+
+def test_apply_filters_like_prefix_rewrite_explicit_collation():
+    name = Column("name", String(collation="de_DE"))
+    Table("collated_users", MetaData(), name)
+
+    with like_prefix_rewrite.set(True):
+        stmt = apply_filters(select(name), {"name": {FilterOperator.like: "jo%"}})
+
+    compiled = stmt.whereclause.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    assert str(compiled).replace("%%", "%") == (
+        """(collated_users.name COLLATE "C") >= 'jo' AND (collated_users.name COLLATE "C") < 'jp' """
+        """AND collated_users.name LIKE 'jo%'"""
+    )
+
+
+def test_apply_filters_like_prefix_rewrite_sqlite():
+    engine = create_engine("sqlite://")
+    KeysetBase.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add_all(Item(id=i, name=name) for i, name in enumerate(["item", "Item-1", "items", "iten", "ITEM-2"]))
+        session.commit()
+
+        for op, pattern in [(FilterOperator.like, "item%"), (FilterOperator.ilike, "ITEM%")]:
+            stmt = apply_filters(select(Item.name), {"name": {op: pattern}}).order_by(Item.id)
+            expected = session.scalars(stmt).all()
+
+            with like_prefix_rewrite.set(True):
+                stmt = apply_filters(select(Item.name), {"name": {op: pattern}}).order_by(Item.id)
+
+            assert session.scalars(stmt).all() == expected
+
+
+def test_apply_filters_count():
+    stmt = apply_filters_count(
+        select(User).options(joinedload(User.group)).order_by(User.created_at).limit(10).offset(20),
+        {"age": {FilterOperator.gt: 18}},
+    )
+
+    assert _compile_expr(stmt) == "SELECT count(*) AS count_1 \nFROM users \nWHERE users.age > 18"
+
+
+def test_build_count_statement_grouped():
+    stmt = build_count_statement(select(User.group_id).distinct().order_by(User.group_id).limit(10))
+
+    assert _compile_expr(stmt) == (
+        "SELECT count(*) AS count_1 \nFROM (SELECT DISTINCT users.group_id AS group_id \nFROM users) AS anon_1"
+    )
+
+
+def test_apply_filters_count_sqlite():
+    engine = create_engine("sqlite://")
+    KeysetBase.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add_all(Item(id=i, name=f"item-{i % 3}", score=i % 4) for i in range(1, 21))
+        session.commit()
+
+        filters = {"score": {FilterOperator.ge: 1}}
+        stmt = apply_filters(select(Item), filters)
+
+        assert session.scalar(build_count_statement(stmt.order_by(Item.id).limit(5))) == len(
+            session.scalars(stmt).all(),
+        )
+        assert session.scalar(apply_filters_count(select(Item.name).distinct(), filters)) == 3  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("offset", "skip", "expected"),
+    [
+        (0, False, ([1, 2, 3, 4, 6], 8)),
+        (5, False, ([7, 8, 9], 8)),
+        (5, True, ([7, 8, 9], 8)),
+        (10, True, ([], 8)),
+    ],
+)
+async def test_fetch_page_and_count(tmp_path, offset, skip, expected):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}")
+    session_factory = async_sessionmaker(engine)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(KeysetBase.metadata.create_all)
+
+    async with session_factory.begin() as session:
+        session.add_all(Item(id=i, name=f"item-{i}", score=i % 5) for i in range(1, 11))
+
+    stmt = apply_filters_and_sorting(select(Item), {"score": {FilterOperator.ne: 0}}, [("id", "asc", None)])
+    page = await fetch_page_and_count(session_factory, stmt, limit=5, offset=offset, skip_count_for_short_page=skip)
+
+    assert ([item.id for item in page.items], page.total) == expected
+
+    await engine.dispose()
+
+
+def test_explain_rows_statement():
+    stmt = _Explain(_get_rows_statement(select(User).where(User.age > 18).order_by(User.id).limit(10)))  # noqa: PLR2004
+
+    assert str(stmt.compile(dialect=postgresql.dialect())) == (
+        "EXPLAIN (FORMAT JSON) SELECT 1 \nFROM users \nWHERE users.age > %(age_1)s"
+    )
+
+
+@pytest.mark.asyncio
+async def test_fetch_count(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}")
+    session_factory = async_sessionmaker(engine)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(KeysetBase.metadata.create_all)
+
+    _counts_cache.clear()
+    filters = {"score": {FilterOperator.ge: 1, FilterOperator.lt: 3}}
+    reordered = {"score": {FilterOperator.lt: 3, FilterOperator.ge: 1}}
+
+    async with session_factory() as session:
+        session.add_all(Item(id=i, name=f"item-{i}", score=i % 5) for i in range(1, 11))
+        await session.flush()
+
+        # estimates are used only on PostgreSQL
+        with approximate_count_threshold.set(1):
+            assert await fetch_count(session, select(Item), filters) == FilteredCount(total=4, exact=True)
+
+        with count_cache_ttl.set(60):
+            assert (await fetch_count(session, select(Item), filters)).total == 4  # noqa: PLR2004
+
+            session.add(Item(id=11, name="item-11", score=1))
+            await session.flush()
+
+            assert (await fetch_count(session, select(Item), reordered)).total == 4  # noqa: PLR2004
+            assert (await fetch_count(session, select(Item), {"score": {FilterOperator.ge: 2}})).total == 6  # noqa: PLR2004
+
+        assert (await fetch_count(session, select(Item), filters)).total == 5  # noqa: PLR2004
+
+    assert _counts_cache.stats().hits == 1
+    await engine.dispose()
+
+
+def test_apply_filters_many_to_one_path():
+    stmt = apply_filters(
+        select(User),
+        {"group__name": {FilterOperator.eq: "admins"}, "group.created_at": {FilterOperator.is_null: True}},
+    )
+    stmt = apply_filters(stmt, {"group__id": {FilterOperator.gt: 1}, "name": {FilterOperator.eq: "john"}})
+
+    assert _compile_expr(stmt.with_only_columns(User.id)) == (
+        "SELECT users.id \n"
+        "FROM users LEFT OUTER JOIN groups AS groups_1 ON groups_1.id = users.group_id \n"
+        "WHERE groups_1.name = 'admins' AND groups_1.created_at IS NULL AND groups_1.id > 1 AND users.name = 'john'"
+    )
+
+
+def test_apply_filters_one_to_many_path():
+    stmt = apply_filters(select(Group), {"users__age": {FilterOperator.gt: 18, FilterOperator.lt: 30}})
+
+    assert _compile_expr(stmt.with_only_columns(Group.id)) == (
+        "SELECT groups.id \n"
+        "FROM groups \n"
+        "WHERE EXISTS (SELECT 1 \n"
+        "FROM users \n"
+        "WHERE groups.id = users.group_id AND users.age > 18 AND users.age < 30)"
+    )
+
+    with pytest.raises(ValueError, match=r"^Unknown field users__unknown$"):
+        apply_filters(select(Group), {"users__unknown": {FilterOperator.eq: 1}})
+
+
+PathBase = declarative_base()
+
+
+class Author(PathBase):
+    __tablename__ = "authors"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+
+    books = relationship("Book", back_populates="author")
+
+
+class Book(PathBase):
+    __tablename__ = "books"
+
+    id = Column(Integer, primary_key=True)
+    author_id = Column(ForeignKey("authors.id"))
+    title = Column(String)
+
+    author = relationship("Author", back_populates="books")
+
+
+def test_apply_filters_relationship_paths_sqlite():
+    engine = create_engine("sqlite://")
+    PathBase.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add_all(
+            [
+                Author(id=1, name="a", books=[Book(id=1, title="x"), Book(id=2, title="y"), Book(id=3, title="y")]),
+                Author(id=2, name="b", books=[Book(id=4, title="y")]),
+                Author(id=3, name="c"),
+            ],
+        )
+        session.commit()
+
+        authors = apply_filters(select(Author.id), {"books__title": {FilterOperator.eq: "y"}}).order_by(Author.id)
+        books = apply_filters(select(Book.id), {"author__name": {FilterOperator.ne: "b"}}).order_by(Book.id)
+
+        assert session.scalars(authors).all() == [1, 2]
+        assert session.scalars(books).all() == [1, 2, 3]
+
+
+def test_create_filters_from_orm_relationship_paths():
+    resolver = create_filters_from_orm(Book, include={"title", "author__name"})
+
+    assert {field for field, _ in resolver.__defs__.values()} == {"title", "author__name"}
+
+    with pytest.raises(ValueError, match=r"^Unknown field author__unknown$"):
+        create_filters_from_orm(Book, include={"author__unknown"})
+
+
+def test_orm_columns_cache():
+    configure_mappers()
+    stats = orm_columns_cache_stats()
+
+    create_filters_from_orm(Author, include={"name"})
+    create_sorting_from_orm(Author)
+    create_filters_from_orm(Author, exclude={"id"})
+
+    assert orm_columns_cache_stats().hits == stats.hits + 2
+    assert [column.name for column in _get_orm_columns(Author).columns] == ["id", "name"]
+
+    class Review(PathBase):
+        __tablename__ = "reviews"
+
+        id = Column(Integer, primary_key=True)
+        author_id = Column(ForeignKey("authors.id"))
+
+        author = relationship("Author", backref="reviews")
+
+    # mapper configuration adds Author.reviews and invalidates cached inspection
+    configure_mappers()
+
+    assert orm_columns_cache_stats().size == 0
+    assert "reviews" in _get_orm_columns(Author).names
+
+
+@async_fixture
+async def items_session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(KeysetBase.metadata.create_all)
+
+    session_factory = async_sessionmaker(engine)
+    async with session_factory.begin() as session:
+        session.add_all(Item(id=i, name=f"item-{i}", score=i % 3) for i in range(1, 9))
+
+    yield session_factory
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_stream_rows(items_session_factory):
+    stmt = select(Item).where(Item.score != 0).order_by(Item.id)
+
+    with stream_chunk_size.set(2):
+        chunks = [chunk async for chunk in stream_rows(items_session_factory, stmt)]
+
+    assert [[row["id"] for row in chunk] for chunk in chunks] == [[1, 2], [4, 5], [7, 8]]
+    assert chunks[0][0] == {"id": 1, "name": "item-1", "score": 1, "created_at": None}
+
+    stmt = select(Item.id, Item.name.label("title")).order_by(Item.id).limit(3)
+    assert [chunk async for chunk in stream_rows(items_session_factory, stmt, chunk_size=5)] == [
+        [{"id": 1, "title": "item-1"}, {"id": 2, "title": "item-2"}, {"id": 3, "title": "item-3"}],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream_rows_chunk_size_from_config(items_session_factory):
+    stmt = select(Item.id).where(Item.score != 0).order_by(Item.id)
+
+    with stream_chunk_size.set(3):
+        config = ConfigSnapshot.capture()
+
+    chunks = stream_rows(items_session_factory, stmt, config=config)
+    with stream_chunk_size.set(1):
+        assert [[row["id"] for row in chunk] async for chunk in chunks] == [[1, 2, 4], [5, 7, 8]]
+
+    response = create_streaming_response(items_session_factory, stmt, {}, [], config=config)
+    assert [chunk async for chunk in response.body_iterator] == [
+        b'{"id":1}\n{"id":2}\n{"id":4}\n',
+        b'{"id":5}\n{"id":7}\n{"id":8}\n',
+    ]
+
+
+@pytest.mark.asyncio
+async def test_create_streaming_response(items_session_factory):
+    filters = {"score": {FilterOperator.eq: 1}}
+    sorting = [("id", "desc", None)]
+
+    response = create_streaming_response(
+        items_session_factory,
+        select(Item.id, Item.name),
+        filters,
+        sorting,
+        chunk_size=2,
+    )
+    chunks = [chunk async for chunk in response.body_iterator]
+
+    assert response.media_type == "application/x-ndjson"
+    assert chunks == [b'{"id":7,"name":"item-7"}\n{"id":4,"name":"item-4"}\n', b'{"id":1,"name":"item-1"}\n']
+
+    response = create_streaming_response(
+        items_session_factory, select(Item.id, Item.name), filters, sorting, format="csv"
+    )
+    chunks = [chunk async for chunk in response.body_iterator]
+
+    assert response.media_type == "text/csv"
+    assert chunks == ["id,name\r\n7,item-7\r\n4,item-4\r\n1,item-1\r\n"]
+
+
+def test_create_filters_from_orm_follows_disabled_filters():
+    resolver = create_filters_from_orm(Author, include={"name"})
+    assert FilterOperator.like in {op for _, op in resolver.__defs__.values()}
+
+    with disabled_filters.set([FilterOperator.like, FilterOperator.ilike]):
+        resolver = create_filters_from_orm(Author, include={"name"})
+
+    assert {FilterOperator.like, FilterOperator.ilike}.isdisjoint(op for _, op in resolver.__defs__.values())
@@ -0,0 +1,34 @@
+import pytest
+
+pytest.importorskip("beanie")
+
+from beanie.odm.operators.find.comparison import NE, Eq, In  # noqa: E402
+
+from fastapi_filters.ext.beanie import apply_filters  # noqa: E402
+from fastapi_filters.operators import FilterOperator  # noqa: E402
+from fastapi_filters.simplify import filters_simplification_config  # noqa: E402
+
+
+class _FindMany:
+    def __init__(self) -> None:
+        self.queries: list[object] = []
+
+    def find(self, *conditions):
+        self.queries.extend(cond.query for cond in conditions)
+        return self
+
+
+@pytest.mark.parametrize(
+    ("filters", "expected"),
+    [
+        # $ne/$nin match null and missing fields, so is_null is kept
+        ({FilterOperator.is_null: True, FilterOperator.ne: 1}, [Eq("age", None), NE("age", 1)]),
+        ({FilterOperator.is_null: False, FilterOperator.not_in: [1, 1]}, [NE("age", None), NE("age", 1)]),
+        ({FilterOperator.gt: 5, FilterOperator.lt: 3}, [In("_id", [])]),
+    ],
+)
+def test_apply_filters_simplification(filters, expected):
+    with filters_simplification_config.set(True):
+        stmt = apply_filters(_FindMany(), {"age": filters})
+
+    assert stmt.queries == [cond.query for cond in expected]
@@ -0,0 +1,76 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fastapi_filters.cache import CacheStats, LRUCache, TTLCache, freeze
+
+
+def test_lru_cache():
+    cache: LRUCache[str, int] = LRUCache(maxsize=2)
+
+    assert cache.get("a") is None
+    assert cache.get_or_create("a", lambda: 1) == 1
+    assert cache.get_or_create("a", lambda: 2) == 1
+
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert len(cache) == 2  # noqa: PLR2004
+    assert cache.stats() == CacheStats(hits=2, misses=2, size=2, maxsize=2)
+
+    cache.clear()
+    assert cache.stats() == CacheStats(hits=0, misses=0, size=0, maxsize=2)
+
+
+def test_ttl_cache():
+    now = 0.0
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=10, timer=lambda: now)
+
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=20)
+
+    now = 10
+    assert cache.get("a") is None
+    assert cache.get("b") == 2  # noqa: PLR2004
+
+    cache.set("c", 3)
+    cache.set("d", 4)
+    assert "b" not in cache
+    assert len(cache._expires) == 2  # noqa: PLR2004, SLF001
+
+    now = 30
+    assert cache.get("c") is None
+    assert cache.stats() == CacheStats(hits=1, misses=2, size=1, maxsize=2)
+
+
+@pytest.mark.parametrize("cache_cls", [LRUCache, TTLCache])
+def test_cache_concurrent_access(cache_cls):
+    cache = cache_cls(maxsize=4)
+
+    def _worker(offset: int) -> None:
+        for i in range(20_000):
+            cache.get_or_create((i + offset) % 8, lambda i=i: i)
+
+    # switch threads as often as possible, so evictions happen between lookup and move_to_end
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for future in [executor.submit(_worker, offset) for offset in range(4)]:
+                future.result()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert len(cache) == 4  # noqa: PLR2004
+
+
+def test_freeze():
+    assert freeze({"a": [1, {2}]}) == freeze({"a": [1, {2}]})
+    assert hash(freeze({"a": [1, {2}]}))
+
+    with pytest.raises(TypeError):
+        freeze(object.__new__(type("Unhashable", (), {"__hash__": None})))
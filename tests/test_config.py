@@ -1,7 +1,7 @@
 import pytest
 from fastapi import Depends, status
 
-from fastapi_filters.config import ConfigVar
+from fastapi_filters.config import ConfigSnapshot, ConfigVar, get_config_vars
 
 
 def test_config_var():
@@ -42,3 +42,17 @@ async def test_config_var_dependency(app, client):
 
     assert response.status_code == status.HTTP_200_OK
     assert var.get() == 1
+
+
+def test_config_snapshot():
+    var = ConfigVar("test", default=1)
+
+    with var.set(2):
+        snapshot = ConfigSnapshot.capture()
+
+    assert var in get_config_vars()
+    assert snapshot[var] == 2
+    assert var.get() == 1
+
+    other_var = ConfigVar("other", default=3)
+    assert snapshot[other_var] == 3
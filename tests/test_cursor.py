@@ -0,0 +1,44 @@
+from datetime import datetime
+
+import pytest
+from fastapi import Depends, status
+
+from fastapi_filters.cursor import CursorValues, create_cursor, decode_cursor, encode_cursor
+
+
+def test_encode_decode_cursor():
+    cursor = encode_cursor(["name", 10, None, datetime(2024, 1, 1)])  # noqa: DTZ001
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == ["name", 10, None, "2024-01-01T00:00:00"]
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "e30", "bm90IGpzb24"])
+def test_decode_invalid_cursor(cursor):
+    with pytest.raises(ValueError, match=r"^Invalid cursor$"):
+        decode_cursor(cursor)
+
+
+@pytest.mark.asyncio
+async def test_cursor_as_dep(app, client):
+    @app.get("/")
+    async def route(cursor: CursorValues | None = Depends(create_cursor())) -> CursorValues | None:
+        return cursor
+
+    res = await client.get("/")
+
+    assert res.status_code == status.HTTP_200_OK
+    assert res.json() is None
+
+    res = await client.get("/", params={"cursor": encode_cursor(["a", 1])})
+
+    assert res.status_code == status.HTTP_200_OK
+    assert res.json() == ["a", 1]
+
+    res = await client.get("/", params={"cursor": "invalid"})
+
+    assert res.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+    (param,) = app.openapi()["paths"]["/"]["get"]["parameters"]
+    assert param["name"] == "cursor"
+    assert param["schema"]["anyOf"] == [{"type": "string"}, {"type": "null"}]
@@ -0,0 +1,146 @@
+import sqlite3
+import subprocess
+import sys
+
+import pytest
+
+from fastapi_filters import FilterField, FilterSet
+from fastapi_filters.ext.fast_sql import apply_filters, apply_filters_and_sorting, apply_sorting
+from fastapi_filters.operators import FilterOperator
+from fastapi_filters.simplify import filters_simplification_config
+
+
+class UserFilters(FilterSet):
+    age: FilterField[int]
+    name: FilterField[str]
+
+
+FIELDS = {"age", "name", "tags"}
+
+
+def test_apply_filters_returns_none_for_empty_filters():
+    assert apply_filters({}, fields=FIELDS) is None
+
+
+@pytest.mark.parametrize(
+    ("dialect", "stmt", "args"),
+    [
+        (
+            "postgresql",
+            '"age" > $3 AND "age" = ANY($4) AND "age" != ALL($5) AND "user_name" ILIKE $6 AND "tags" && $7',
+            (18, [1, 2], [3], "%john%", ["a"]),
+        ),
+        (
+            "psycopg",
+            '"age" > %s AND "age" = ANY(%s) AND "age" != ALL(%s) AND "user_name" ILIKE %s AND "tags" && %s',
+            (18, [1, 2], [3], "%john%", ["a"]),
+        ),
+    ],
+)
+def test_apply_filters_postgresql(dialect, stmt, args):
+    compiled = apply_filters(
+        {
+            "age": {FilterOperator.gt: 18, FilterOperator.in_: [1, 2], FilterOperator.not_in: [3]},
+            "name": {FilterOperator.ilike: "%john%"},
+            "tags": {FilterOperator.overlap: ["a"]},
+        },
+        fields=FIELDS,
+        remapping={"name": "user_name"},
+        dialect=dialect,
+        arg_start=3,
+    )
+
+    assert compiled is not None
+    assert compiled.stmt == stmt
+    assert compiled.args == args
+    assert (compiled.start, compiled.end, compiled.is_positional) == (3, 8, True)
+
+
+def test_apply_filters_sqlite():
+    compiled = apply_filters(
+        {
+            "age": {FilterOperator.in_: [1, 2], FilterOperator.not_in: [], FilterOperator.is_null: False},
+            "name": {FilterOperator.not_ilike: "%john%"},
+        },
+        fields=FIELDS,
+        dialect="sqlite",
+    )
+
+    assert compiled is not None
+    assert compiled.stmt == '"age" IN (?, ?) AND 1 = 1 AND "age" IS NOT NULL AND lower("name") NOT LIKE lower(?)'
+    assert compiled.args == (1, 2, "%john%")
+    assert compiled.params == {"param_1": 1, "param_2": 2, "param_3": "%john%"}
+
+
+def test_apply_filters_and_sorting_sqlite_execute():
+    conn = sqlite3.connect(":memory:")
+    conn.execute('CREATE TABLE users (age INTEGER, "first name" TEXT)')
+    conn.executemany("INSERT INTO users VALUES (?, ?)", [(i, f"John {i}") for i in range(10)])
+
+    filters, sorting = apply_filters_and_sorting(
+        UserFilters(age={FilterOperator.ge: 3, FilterOperator.not_in: [5]}, name={FilterOperator.ilike: "john%"}),
+        [("age", "desc", None)],
+        remapping={"name": "first name"},
+        dialect="sqlite",
+    )
+
+    assert filters is not None
+    assert sorting is not None
+
+    rows = conn.execute(f"SELECT age FROM users WHERE {filters.stmt} ORDER BY {sorting.stmt}", filters.args)  # noqa: S608
+    assert [age for (age,) in rows] == [9, 8, 7, 6, 4, 3]
+
+
+def test_apply_filters_rejects_undeclared_fields():
+    with pytest.raises(ValueError, match=r'^Unknown field age" OR 1=1 --$'):
+        apply_filters({'age" OR 1=1 --': {FilterOperator.eq: 1}}, fields=FIELDS)
+
+    with pytest.raises(ValueError, match=r"^fields are required to apply filters values$"):
+        apply_filters({"age": {FilterOperator.eq: 1}})
+
+
+def test_apply_filters_quotes_identifiers():
+    compiled = apply_filters({"name": {FilterOperator.eq: "john"}}, fields=FIELDS, remapping={"name": 'u.na"me'})
+
+    assert compiled is not None
+    assert compiled.stmt == '"u"."na""me" = $1'
+
+
+def test_apply_filters_raises_for_unsupported_operator():
+    with pytest.raises(NotImplementedError, match=r"^Operator FilterOperator.overlap is not implemented$"):
+        apply_filters({"tags": {FilterOperator.overlap: ["a"]}}, fields=FIELDS, dialect="sqlite")
+
+
+def test_apply_sorting():
+    compiled = apply_sorting(
+        [("age", "asc", "smaller"), ("name", "desc", None)],
+        fields=FIELDS,
+        arg_start=4,
+    )
+
+    assert compiled is not None
+    assert compiled.stmt == '"age" ASC NULLS FIRST, "name" DESC'
+    assert compiled.args == ()
+    assert compiled.arg_start == 4
+
+    assert apply_sorting([], fields=FIELDS) is None
+
+    with pytest.raises(ValueError, match=r"^Unknown sorting direction invalid$"):
+        apply_sorting([("age", "invalid", None)], fields=FIELDS)
+
+
+def test_apply_filters_simplification():
+    with filters_simplification_config.set(True):
+        unsatisfiable = apply_filters({"age": {FilterOperator.eq: 1, FilterOperator.in_: [2]}}, fields=FIELDS)
+        simplified = apply_filters({"age": {FilterOperator.in_: [2, 2]}}, fields=FIELDS, arg_start=3)
+
+    assert unsatisfiable is not None
+    assert (unsatisfiable.stmt, unsatisfiable.args) == ("1 != 1", ())
+    assert simplified is not None
+    assert (simplified.stmt, simplified.args) == ('"age" = $3', (2,))
+
+
+def test_import_does_not_load_sqlalchemy():
+    code = "import sys, fastapi_filters.ext.fast_sql; assert 'sqlalchemy' not in sys.modules"
+
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
@@ -1,3 +1,4 @@
+import inspect
 from dataclasses import dataclass, fields
 from typing import Any
 
@@ -10,7 +11,11 @@ from fastapi_filters import (
     FilterSet,
     create_filters,
     create_filters_from_set,
+    filter_set,
 )
+from fastapi_filters.configs import alias_generator, filters_resolver_factory
+from fastapi_filters.filter_set import _filters_from_set
+from fastapi_filters.resolvers import create_query_params_resolver
 from fastapi_filters.types import AbstractFilterOperator
 from fastapi_filters.utils import unwrap_annotated
 
@@ -93,6 +98,45 @@ def test_filter_set_inherited_customization_preserved():
     assert _Child.__filters__["a"].operators == [FilterOperator.eq, FilterOperator.ne]
 
 
+def test_filter_set_resolver_is_lazy(monkeypatch):
+    calls = []
+    monkeypatch.setattr(filter_set, "create_filters", lambda **kwargs: calls.append(kwargs) or create_filters(**kwargs))
+
+    class _Base(FilterSet):
+        a: FilterField[int]
+
+    class _Child(_Base):
+        b: FilterField[str]
+
+    assert calls == []
+
+    (param,) = inspect.signature(_Child).parameters.values()
+
+    assert [call.keys() for call in calls] == [{"a", "b", "hooks"}]
+    assert param.default.dependency is _filters_from_set(_Child)
+    assert param.default.dependency.__filters__.keys() == {"a", "b"}
+
+
+def test_filter_set_resolver_follows_config():
+    class _Filters(FilterSet):
+        a: FilterField[int]
+
+    default = _filters_from_set(_Filters)
+    inspect.signature(_Filters)
+
+    with filters_resolver_factory.set(create_query_params_resolver):
+        assert _filters_from_set(_Filters) is not default
+
+    with alias_generator.set(lambda name, op, _: f"{name}__{op.name}"):
+        resolver = _filters_from_set(_Filters)
+
+    assert resolver is not default
+    aliases = {getattr(meta, "alias", None) for field in fields(resolver.__model__) for meta in field.type.__metadata__}
+    assert "a__ne" in aliases
+
+    assert _filters_from_set(_Filters) is default
+
+
 def test_filter_set_reused_field():
     shared = FilterField(operators=[FilterOperator.eq, FilterOperator.ne])
 
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from typing import Annotated
 
 import pytest
@@ -11,6 +12,7 @@ from fastapi_filters import (
     create_filters,
     create_filters_from_model,
 )
+from fastapi_filters.filters import FiltersCreateHooks
 
 
 @pytest.mark.asyncio
@@ -175,3 +177,34 @@ async def test_filters_from_model(app):
         "name__ilike": ("name", FilterOperator.ilike),
         "name__not_ilike": ("name", FilterOperator.not_ilike),
     }
+
+
+def test_create_filters_shares_resolver():
+    first = create_filters(a=int, b=FilterField(str, alias="b_alias"))
+    second = create_filters(a=int, b=FilterField(str, alias="b_alias"))
+
+    assert first is second
+    assert create_filters(a=int, b=str) is not first
+
+
+def test_create_filters_stateful_hooks_not_shared():
+    @dataclass
+    class _Hooks(FiltersCreateHooks):
+        prefix: str = "p"
+
+    assert create_filters(hooks=_Hooks(), a=int) is not create_filters(hooks=_Hooks(), a=int)
+
+
+def test_create_filters_slots_hooks_not_shared():
+    @dataclass(slots=True)
+    class _Hooks(FiltersCreateHooks):
+        prefix: str
+
+        def filter_field_generate_alias(self, name, op, alias=None):
+            return f"{self.prefix}{name}[{op.name}]"
+
+    first = create_filters(hooks=_Hooks("x_"), a=int)
+    second = create_filters(hooks=_Hooks("y_"), a=int)
+
+    assert first is not second
+    assert create_filters(hooks=FiltersCreateHooks(), a=int) is create_filters(a=int)
@@ -2,14 +2,19 @@ import pytest
 from sqlalchemy import Integer, String
 
 from fastapi_filters import FilterField, FilterSet
+from fastapi_filters.cache import CacheStats
 from fastapi_filters.ext.raw_sql import (
+    _templates_cache,
     apply_filters,
     apply_filters_and_sorting,
     apply_sorting,
     default_compile_kwargs,
     default_dialect,
+    templates_cache_stats,
 )
+from fastapi_filters.ext.sqlalchemy import in_list_offload_threshold, in_list_strategy, like_prefix_rewrite
 from fastapi_filters.operators import FilterOperator
+from fastapi_filters.simplify import filters_simplification_config
 
 
 class UserFilters(FilterSet):
@@ -110,3 +115,191 @@ def test_apply_filters_and_sorting_offsets_positional_sort_args():
     assert filters.is_positional is True
     assert sorting.stmt == "score DESC"
     assert sorting.args == ()
+
+
+@pytest.mark.parametrize(
+    ("strategy", "stmt", "args"),
+    [
+        ("in", "age IN ($1::INTEGER, $2::INTEGER, $3::INTEGER) AND (age NOT IN ($4::INTEGER))", (1, 2, 3, 4)),
+        ("any", "age = ANY ($1::INTEGER[]) AND age != ALL ($2::INTEGER[])", ([1, 2, 3], [4])),
+        (
+            "bucket",
+            "age IN ($1::INTEGER, $2::INTEGER, $3::INTEGER, $4::INTEGER) AND (age NOT IN ($5::INTEGER))",
+            (1, 2, 3, 3, 4),
+        ),
+    ],
+)
+def test_apply_filters_in_list_strategy(strategy, stmt, args):
+    with in_list_strategy.set(strategy):
+        compiled = apply_filters(
+            {"age": {FilterOperator.in_: [1, 2, 3], FilterOperator.not_in: [4]}},
+            dialect="postgresql+asyncpg",
+            types={"age": Integer()},
+        )
+
+    assert compiled is not None
+    assert compiled.stmt == stmt
+    assert compiled.args == args
+
+
+@pytest.mark.parametrize(
+    ("dialect", "stmt", "args"),
+    [
+        ("postgresql+asyncpg", "age = ANY ($1::INTEGER[]) AND (age NOT IN ($2::INTEGER))", ([1, 2, 3], 4)),
+        ("sqlite", "age IN (1, 2, 3) AND (age NOT IN (?))", (4,)),
+    ],
+)
+def test_apply_filters_in_list_offload(dialect, stmt, args):
+    with in_list_offload_threshold.set(2):
+        compiled = apply_filters(
+            {"age": {FilterOperator.in_: [1, 2, 3], FilterOperator.not_in: [4]}},
+            dialect=dialect,
+            types={"age": Integer()},
+        )
+
+    assert compiled is not None
+    assert compiled.stmt == stmt
+    assert compiled.args == args
+
+
+@pytest.fixture
+def templates_cache():
+    _templates_cache.clear()
+    yield
+    _templates_cache.clear()
+
+
+@pytest.mark.usefixtures("templates_cache")
+@pytest.mark.parametrize("strategy", ["in", "any", "bucket"])
+def test_apply_filters_reuses_compiled_template(strategy):
+    def _compile(age, ids, name):
+        with in_list_strategy.set(strategy):
+            compiled = apply_filters(
+                {"age": {FilterOperator.gt: age}, "id": {FilterOperator.in_: ids}, "name": {FilterOperator.eq: name}},
+                dialect="postgresql+asyncpg",
+                arg_start=3,
+                types={"age": Integer()},
+            )
+
+        assert compiled is not None
+        return compiled
+
+    first = _compile(18, [1, 2, 3], "john")
+    second = _compile(21, [4, 5, 6], "jane")
+
+    assert second.stmt == first.stmt
+    assert templates_cache_stats() == CacheStats(hits=1, misses=1, size=1, maxsize=1024)
+
+    _templates_cache.clear()
+    assert second.args == _compile(21, [4, 5, 6], "jane").args
+
+
+@pytest.mark.usefixtures("templates_cache")
+def test_apply_filters_template_depends_on_values_shape():
+    for filters in [
+        {"age": {FilterOperator.in_: [1, 2]}},
+        {"age": {FilterOperator.in_: [1, 2, 3]}},
+        {"age": {FilterOperator.in_: ["1", "2", "3"]}},
+        {"age": {FilterOperator.is_null: True}},
+        {"age": {FilterOperator.is_null: False}},
+    ]:
+        apply_filters(filters, dialect="postgresql+asyncpg")
+
+    assert templates_cache_stats() == CacheStats(hits=0, misses=5, size=5, maxsize=1024)
+
+    compiled = apply_filters({"age": {FilterOperator.is_null: False}}, dialect="postgresql+asyncpg")
+    assert compiled is not None
+    assert compiled.stmt == "age IS NOT NULL"
+
+
+@pytest.mark.usefixtures("templates_cache")
+def test_apply_filters_does_not_reuse_template_with_inline_values():
+    for age in (18, 21):
+        with default_compile_kwargs.set({"literal_binds": True}):
+            compiled = apply_filters({"age": {FilterOperator.gt: age}}, dialect="postgresql", types={"age": Integer()})
+
+        assert compiled is not None
+        assert compiled.stmt == f"age > {age}"
+
+
+def test_apply_filters_numbers_placeholders_from_arg_start():
+    compiled = apply_filters(
+        {"name": {FilterOperator.eq: "$1 costs 50%"}, "age": {FilterOperator.in_: [1, 2], FilterOperator.gt: 3}},
+        dialect="postgresql+asyncpg",
+        arg_start=5,
+        types={"name": String()},
+    )
+
+    assert compiled is not None
+    assert compiled.stmt == "name = $5::VARCHAR AND age IN ($6::INTEGER, $7::INTEGER) AND age > $8::INTEGER"
+    assert compiled.args == ("$1 costs 50%", 1, 2, 3)
+    assert (compiled.start, compiled.end) == (5, 9)
+
+    with default_compile_kwargs.set({"literal_binds": True}):
+        compiled = apply_filters({"name": {FilterOperator.like: "$1 50%"}}, dialect="postgresql+asyncpg", arg_start=5)
+
+    assert compiled is not None
+    assert compiled.stmt == "name LIKE '$1 50%'"
+
+
+def test_apply_filters_and_sorting_qmark_placeholders():
+    filters, sorting = apply_filters_and_sorting(
+        {"age": {FilterOperator.gt: 18}},
+        [("score", "desc", None)],
+        dialect="sqlite",
+    )
+
+    assert filters is not None
+    assert sorting is not None
+    assert filters.stmt == "age > ?"
+    assert sorting.stmt == "score DESC"
+    assert sorting.arg_start == 2
+
+
+@pytest.mark.parametrize(
+    ("filters", "stmt", "args"),
+    [
+        ({"age": {FilterOperator.gt: 5, FilterOperator.ge: 10, FilterOperator.in_: [1]}}, "false", ()),
+        (
+            {"age": {FilterOperator.gt: 5, FilterOperator.ge: 10, FilterOperator.not_in: [1, 1]}},
+            "age >= $1 AND age != $2",
+            (10, 1),
+        ),
+    ],
+)
+def test_apply_filters_simplification(filters, stmt, args):
+    with filters_simplification_config.set(True):
+        compiled = apply_filters(filters, dialect="postgresql+asyncpg")
+
+    assert compiled is not None
+    assert compiled.stmt == stmt.replace("$1", "$1::INTEGER").replace("$2", "$2::INTEGER")
+    assert compiled.args == args
+
+
+@pytest.mark.usefixtures("templates_cache")
+def test_apply_filters_like_prefix_rewrite():
+    with like_prefix_rewrite.set(True):
+        compiled = [
+            apply_filters(
+                {"name": {FilterOperator.ilike: pattern}}, dialect="postgresql+asyncpg", types={"name": String()}
+            )
+            for pattern in ("Jo%", "%jo", "an%")
+        ]
+
+    assert [(c.stmt, c.args) for c in compiled if c is not None] == [
+        (
+            (
+                '(lower(name) COLLATE "C") >= $1::VARCHAR AND (lower(name) COLLATE "C") < $2::VARCHAR '
+                "AND lower(name) LIKE $3::VARCHAR"
+            ),
+            ("jo", "jp", "jo%"),
+        ),
+        ("lower(name) LIKE $1::VARCHAR", ("%jo",)),
+        (
+            (
+                '(lower(name) COLLATE "C") >= $1::VARCHAR AND (lower(name) COLLATE "C") < $2::VARCHAR '
+                "AND lower(name) LIKE $3::VARCHAR"
+            ),
+            ("an", "ao", "an%"),
+        ),
+    ]
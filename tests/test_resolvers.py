@@ -0,0 +1,131 @@
+from typing import Any
+
+import pytest
+from dirty_equals import IsPartialDict
+from fastapi import Depends, FastAPI, Header, status
+
+from fastapi_filters import FilterField, FilterOperator, FilterValues, create_filters
+from fastapi_filters.configs import csv_separator_config, filters_resolver_factory
+from fastapi_filters.docs import _fix_docs
+from fastapi_filters.resolvers import create_batch_query_params_resolver, create_query_params_resolver
+
+
+def _create_filters() -> Any:
+    return create_filters(
+        a=int,
+        b=bool,
+        c=list[str],
+        d=FilterField(
+            bytes,
+            default_op=FilterOperator.eq,
+            operators=[FilterOperator.eq, FilterOperator.ne],
+            alias="d_alias",
+        ),
+    )
+
+
+@pytest.fixture(
+    params=[create_query_params_resolver, create_batch_query_params_resolver],
+    ids=["query_params", "batch_query_params"],
+)
+def resolver_factory(request):
+    return request.param
+
+
+@pytest.fixture
+def resolver(resolver_factory):
+    with filters_resolver_factory.set(resolver_factory):
+        return _create_filters()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {"a": 1, "b": "true", "c": "a,b,c", "d_alias": "123"},
+        {"a[eq]": 1, "a[gt]": 2, "a[lt]": 3, "unknown": "value"},
+        {"a[in]": "1,2,3", "c[contains]": "a", "d[ne]": "abc"},
+    ],
+)
+async def test_query_params_resolver(app, client, resolver, params):
+    @app.get("/default")
+    async def default_route(filters: FilterValues = Depends(_create_filters())) -> FilterValues:
+        return filters
+
+    @app.get("/compiled")
+    async def compiled_route(filters: FilterValues = Depends(resolver)) -> FilterValues:
+        return filters
+
+    default_res = await client.get("/default", params=params)
+    compiled_res = await client.get("/compiled", params=params)
+
+    assert compiled_res.status_code == status.HTTP_200_OK
+    assert compiled_res.json() == default_res.json()
+
+
+@pytest.mark.asyncio
+async def test_query_params_resolver_repeated_params(app, client, resolver):
+    @app.get("/")
+    async def route(filters: FilterValues = Depends(resolver)) -> FilterValues:
+        return filters
+
+    res = await client.get("/", params=[("a", "1"), ("a", "2"), ("c", "a"), ("c", "b,c")])
+
+    assert res.status_code == status.HTTP_200_OK
+    assert res.json() == {"a": {"eq": 2}, "c": {"overlap": ["a", "b", "c"]}}
+
+
+@pytest.mark.asyncio
+async def test_query_params_resolver_csv_separator(app, client, resolver):
+    @app.get("/", dependencies=[Depends(csv_separator_config.dependency(";"))])
+    async def route(filters: FilterValues = Depends(resolver)) -> FilterValues:
+        return filters
+
+    res = await client.get("/", params={"a[in]": "1;2", "c": "a;b"})
+
+    assert res.status_code == status.HTTP_200_OK
+    assert res.json() == {"a": {"in": [1, 2]}, "c": {"overlap": ["a", "b"]}}
+
+
+@pytest.mark.asyncio
+async def test_query_params_resolver_errors(app, client, resolver):
+    @app.get("/")
+    async def route(filters: FilterValues = Depends(resolver)) -> FilterValues:
+        return filters
+
+    res = await client.get("/", params={"a": "abc", "a[in]": "1,abc"})
+
+    assert res.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    assert res.json() == {
+        "detail": [
+            IsPartialDict({"input": "abc", "loc": ["query", "a"], "type": "int_parsing"}),
+            IsPartialDict({"input": "abc", "loc": ["query", "a[in]", 1], "type": "int_parsing"}),
+        ],
+    }
+
+
+def test_query_params_resolver_docs(resolver):
+    default_app = FastAPI()
+    compiled_app = FastAPI()
+
+    @default_app.get("/")
+    async def route(filters: FilterValues = Depends(_create_filters())) -> FilterValues:
+        return filters
+
+    @compiled_app.get("/")
+    async def route(filters: FilterValues = Depends(resolver)) -> FilterValues:  # noqa: F811
+        return filters
+
+    _fix_docs(default_app)
+    _fix_docs(compiled_app)
+
+    assert compiled_app.openapi() == default_app.openapi()
+
+
+def test_query_params_resolver_only_query(resolver_factory):
+    with (
+        filters_resolver_factory.set(resolver_factory),
+        pytest.raises(ValueError, match=r"^Query params resolver supports only query parameters$"),
+    ):
+        create_filters(a=int, in_=Header)
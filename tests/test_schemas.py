@@ -1,10 +1,12 @@
+from typing import Annotated
+
 import pytest
 from dirty_equals import IsPartialDict
 from fastapi import Query, status
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from fastapi_filters.configs import csv_separator_config
-from fastapi_filters.schemas import CSVList
+from fastapi_filters.schemas import CSV_SEPARATOR_CONTEXT_KEY, CSVList
 
 from .utils import parse_obj_as
 
@@ -62,3 +64,27 @@ async def test_csv_list_as_query_param(app, client):
             ),
         ],
     }
+
+
+def test_csv_list_merges_repeated_values():
+    assert parse_obj_as(CSVList[int], ["1,2", "3", "4,5"]) == [1, 2, 3, 4, 5]
+    assert parse_obj_as(CSVList[int], [1, 2]) == [1, 2]
+
+
+def test_csv_list_separator_from_context():
+    adapter = TypeAdapter(CSVList[int])
+
+    assert adapter.validate_python("1;2", context={CSV_SEPARATOR_CONTEXT_KEY: ";"}) == [1, 2]
+    assert adapter.validate_python("1,2", context={}) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_csv_list_repeated_query_param(app, client):
+    @app.get("/")
+    def index(q: Annotated[CSVList[int], Query()]):
+        return q
+
+    res = await client.get("/", params=[("q", "1,2"), ("q", "3")])
+
+    assert res.status_code == status.HTTP_200_OK
+    assert res.json() == [1, 2, 3]
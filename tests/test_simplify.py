@@ -0,0 +1,98 @@
+from datetime import date, datetime, timezone
+from uuid import UUID
+
+import pytest
+
+from fastapi_filters.operators import FilterOperator
+from fastapi_filters.simplify import simplify_filters
+
+
+@pytest.mark.parametrize(
+    ("filters", "expected"),
+    [
+        ({FilterOperator.gt: 5, FilterOperator.ge: 10}, {FilterOperator.ge: 10}),
+        ({FilterOperator.gt: 10, FilterOperator.ge: 10}, {FilterOperator.gt: 10}),
+        ({FilterOperator.lt: 5, FilterOperator.le: 3}, {FilterOperator.le: 3}),
+        ({FilterOperator.ge: 10, FilterOperator.le: 10}, {FilterOperator.eq: 10}),
+        ({FilterOperator.eq: 5, FilterOperator.in_: [5, 6]}, {FilterOperator.eq: 5}),
+        (
+            {FilterOperator.in_: [1, 2, 3, 10], FilterOperator.gt: 1, FilterOperator.ne: 10},
+            {FilterOperator.in_: [2, 3]},
+        ),
+        ({FilterOperator.in_: ["a"]}, {FilterOperator.eq: "a"}),
+        ({FilterOperator.in_: ["a", "b", "a"]}, {FilterOperator.in_: ["a", "b"]}),
+        ({FilterOperator.not_in: ["a", "a"]}, {FilterOperator.ne: "a"}),
+        ({FilterOperator.ne: 1, FilterOperator.not_in: [2, 1]}, {FilterOperator.not_in: [1, 2]}),
+        ({FilterOperator.is_null: False, FilterOperator.gt: 1}, {FilterOperator.gt: 1}),
+        ({FilterOperator.is_null: True}, {FilterOperator.is_null: True}),
+        (
+            {FilterOperator.ge: date(2024, 1, 1), FilterOperator.gt: date(2024, 2, 1)},
+            {FilterOperator.gt: date(2024, 2, 1)},
+        ),
+        (
+            {FilterOperator.eq: UUID(int=1), FilterOperator.in_: [UUID(int=1), UUID(int=2)]},
+            {FilterOperator.eq: UUID(int=1)},
+        ),
+        # strings comparison depends on database collation
+        ({FilterOperator.gt: "b", FilterOperator.lt: "B"}, {FilterOperator.gt: "b", FilterOperator.lt: "B"}),
+        ({FilterOperator.eq: "A", FilterOperator.in_: ["a"]}, {FilterOperator.eq: "A", FilterOperator.in_: ["a"]}),
+        (
+            {FilterOperator.like: "a%", FilterOperator.ilike: "b%"},
+            {FilterOperator.like: "a%", FilterOperator.ilike: "b%"},
+        ),
+    ],
+)
+def test_simplify_filters(filters, expected):
+    assert simplify_filters({"field": filters}, sql_nulls=True) == {"field": expected}
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {FilterOperator.gt: 5, FilterOperator.le: 3},
+        {FilterOperator.gt: 5, FilterOperator.le: 5},
+        {FilterOperator.eq: 7, FilterOperator.in_: [5, 6]},
+        {FilterOperator.eq: 7, FilterOperator.ne: 7},
+        {FilterOperator.in_: [1, 2], FilterOperator.not_in: [2, 1]},
+        {FilterOperator.in_: [1, 2], FilterOperator.gt: 2},
+        {FilterOperator.in_: []},
+        {FilterOperator.in_: ["a"], FilterOperator.is_null: True},
+    ],
+)
+def test_simplify_filters_unsatisfiable(filters):
+    assert simplify_filters({"other": {FilterOperator.eq: 1}, "field": filters}, sql_nulls=True) is None
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {FilterOperator.is_null: True, FilterOperator.ne: 1},
+        {FilterOperator.is_null: False, FilterOperator.not_in: [1, 2]},
+    ],
+)
+def test_simplify_filters_keeps_is_null_without_sql_nulls(filters):
+    # MongoDB $ne/$nin and Tortoise __not/__not_in match null values
+    assert simplify_filters({"field": filters}) == {"field": filters}
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {FilterOperator.gt: datetime(2024, 1, 1, tzinfo=timezone.utc), FilterOperator.lt: datetime(2024, 2, 1)},  # noqa: DTZ001
+        {FilterOperator.ge: date(2024, 1, 1), FilterOperator.le: datetime(2024, 2, 1, tzinfo=timezone.utc)},
+        {FilterOperator.in_: [datetime(2024, 1, 1, tzinfo=timezone.utc)], FilterOperator.gt: datetime(2023, 1, 1)},  # noqa: DTZ001
+    ],
+)
+def test_simplify_filters_keeps_incomparable_values(filters):
+    assert simplify_filters({"ts": filters, "age": {FilterOperator.in_: [1, 1]}}) == {
+        "ts": filters,
+        "age": {FilterOperator.eq: 1},
+    }
+
+
+def test_simplify_filters_does_not_modify_values():
+    filters = {"field": {FilterOperator.in_: [1, 1], FilterOperator.gt: 0}}
+
+    simplify_filters(filters)
+
+    assert filters == {"field": {FilterOperator.in_: [1, 1], FilterOperator.gt: 0}}
@@ -1,3 +1,5 @@
+from typing import get_args
+
 import pytest
 from fastapi import Depends, status
 from pydantic import BaseModel
@@ -89,3 +91,66 @@ def test_create_sorting_from_model():
 def test_create_sorting_invalid_default():
     with pytest.raises(ValueError, match=r"^Default sort field invalid is not in .*$"):
         create_sorting("name", "age", "created_at", default="invalid")
+
+
+def test_create_sorting_shares_resolver():
+    assert create_sorting("name", "age", default="name") is create_sorting("name", "age", default=["name"])
+    assert create_sorting("name", "age") is not create_sorting("name", "age", alias="order")
+
+
+@pytest.mark.asyncio
+async def test_compiled_sorting_as_dep(app, client):
+    @app.get("/")
+    async def route(
+        sorting: SortingValues = Depends(
+            create_sorting("name", "age", "created_at", default="-age", compiled=True, max_keys=2),
+        ),
+    ) -> SortingValues:
+        return sorting
+
+    res = await client.get("/")
+
+    assert res.status_code == status.HTTP_200_OK
+    assert res.json() == [["age", "desc", None]]
+
+    res = await client.get("/", params={"sort": "+name,-age"})
+
+    assert res.status_code == status.HTTP_200_OK
+    assert res.json() == [["name", "asc", None], ["age", "desc", None]]
+
+    res = await client.get("/", params=[("sort", "name"), ("sort", "-created_at")])
+
+    assert res.status_code == status.HTTP_200_OK
+    assert res.json() == [["name", "asc", None], ["created_at", "desc", None]]
+
+    for sort, error in [
+        ("invalid", "sort_field"),
+        ("name,-name", "sort_field_duplicate"),
+        ("name,age,created_at", "too_long"),
+    ]:
+        res = await client.get("/", params={"sort": sort})
+
+        assert res.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+        assert [err["type"] for err in res.json()["detail"]] == [error]
+
+    (param,) = app.openapi()["paths"]["/"]["get"]["parameters"]
+    assert param["schema"] == {
+        "type": "array",
+        "items": {"type": "string", "pattern": "^[+-]?(name|age|created_at)$"},
+        "maxItems": 2,
+        "explode": False,
+        "default": ["-age"],
+        "title": "Sort",
+    }
+
+
+def test_compiled_sorting_does_not_build_literal():
+    fields = [f"field_{i}" for i in range(1_000)]
+
+    assert create_sorting(*fields, compiled=True).__tp__ is str
+    assert len(get_args(create_sorting(*fields).__tp__)) == 3_000  # noqa: PLR2004
+
+
+def test_create_sorting_max_keys_requires_compiled():
+    with pytest.raises(ValueError, match=r"^max_keys is supported only by compiled sorting$"):
+        create_sorting("name", max_keys=1)
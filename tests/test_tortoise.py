@@ -0,0 +1,35 @@
+import pytest
+
+pytest.importorskip("tortoise")
+
+from fastapi_filters.ext.tortoise import apply_filters  # noqa: E402
+from fastapi_filters.operators import FilterOperator  # noqa: E402
+from fastapi_filters.simplify import filters_simplification_config  # noqa: E402
+
+
+class _QuerySet:
+    def __init__(self) -> None:
+        self.filters: list[dict[str, object]] = []
+
+    def filter(self, **kwargs):
+        self.filters.append(kwargs)
+        return self
+
+
+@pytest.mark.parametrize(
+    ("filters", "expected"),
+    [
+        # __not/__not_in add "OR IS NULL", so is_null is kept
+        ({FilterOperator.is_null: True, FilterOperator.ne: 1}, [{"age__is_null": True}, {"age__not": 1}]),
+        (
+            {FilterOperator.is_null: False, FilterOperator.not_in: [1, 1]},
+            [{"age__is_null": False}, {"age__not": 1}],
+        ),
+        ({FilterOperator.gt: 5, FilterOperator.lt: 3}, [{"pk__in": []}]),
+    ],
+)
+def test_apply_filters_simplification(filters, expected):
+    with filters_simplification_config.set(True):
+        stmt = apply_filters(_QuerySet(), {"age": filters})
+
+    assert stmt.filters == expected